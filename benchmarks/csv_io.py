@@ -0,0 +1,87 @@
+"""Benchmark ezvalue.csvio against csv.DictReader and csv.DictWriter.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/csv_io.py [row count]
+"""
+
+import csv
+import io
+import sys
+import time
+
+import ezvalue
+
+
+class Record(ezvalue.Value):
+    """A record with a handful of fields."""
+
+    key = """Record key."""
+    name = """Record name."""
+    amount = """Amount in cents."""
+    ratio = """Some ratio."""
+    active = """Active flag."""
+
+
+CONVERTERS = {'key': int, 'amount': int, 'ratio': float}
+
+
+def make_file(count):
+    file = io.StringIO(newline='')
+    writer = csv.writer(file)
+    writer.writerow(Record._fields)
+    for i in range(count):
+        writer.writerow((i, 'name{}'.format(i), i * 7, i / 3.0, i % 2))
+    return file.getvalue()
+
+
+def read_dict_reader(data):
+    records = []
+    for row in csv.DictReader(io.StringIO(data, newline='')):
+        for name, convert in CONVERTERS.items():
+            row[name] = convert(row[name])
+        records.append(Record(**row))
+    return records
+
+
+def read_ezvalue(data):
+    return list(Record.read_csv(io.StringIO(data, newline=''),
+                                converters=CONVERTERS))
+
+
+def write_dict_writer(records):
+    file = io.StringIO(newline='')
+    writer = csv.DictWriter(file, Record._fields)
+    writer.writeheader()
+    for record in records:
+        writer.writerow({name: getattr(record, name) for name in record})
+    return file
+
+
+def write_ezvalue(records):
+    file = io.StringIO(newline='')
+    Record.write_csv(records, file)
+    return file
+
+
+def timed(function, argument):
+    start = time.perf_counter()
+    result = function(argument)
+    return time.perf_counter() - start, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    data = make_file(count)
+    baseline, records = timed(read_dict_reader, data)
+    elapsed, _ = timed(read_ezvalue, data)
+    print('read:  DictReader {:.3f}s, read_csv {:.3f}s, speedup {:.2f}'
+          .format(baseline, elapsed, baseline / elapsed))
+    baseline, _ = timed(write_dict_writer, records)
+    elapsed, _ = timed(write_ezvalue, records)
+    print('write: DictWriter {:.3f}s, write_csv {:.3f}s, speedup {:.2f}'
+          .format(baseline, elapsed, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
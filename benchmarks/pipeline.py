@@ -0,0 +1,68 @@
+"""Benchmark the scaling of ezvalue.pipeline with the number of workers.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/pipeline.py [record count] [chunk size]
+"""
+
+import os
+import sys
+import time
+
+import ezvalue
+from ezvalue.pipeline import Pipeline
+
+
+class Record(ezvalue.Value):
+    """A record with a handful of fields."""
+
+    key = """Record key."""
+    name = """Record name."""
+    amount = """Amount in cents."""
+    ratio = """Some ratio."""
+    active = """Active flag."""
+
+
+def transform(line):
+    key, name, amount, ratio, active = line.split(',')
+    return {'key': int(key), 'name': name, 'amount': int(amount),
+            'ratio': float(ratio), 'active': active == '1'}
+
+
+def validate(record):
+    if record.amount < 0:
+        raise ValueError('negative amount')
+
+
+def lines(count):
+    return ('{0},name{0},{1},{2},{3}'.format(i, i * 7, i / 3.0, i % 2)
+            for i in range(count))
+
+
+def run(count, chunk_size, workers):
+    pipeline = Pipeline(Record, transform=transform, validate=validate,
+                        workers=workers, chunk_size=chunk_size)
+    start = time.perf_counter()
+    for _ in pipeline.map(lines(count)):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    baseline = run(count, chunk_size, 0)
+    print('{:>8} {:>10} {:>12} {:>8}'.format(
+        'workers', 'seconds', 'records/s', 'speedup'))
+    print('{:>8} {:>10.3f} {:>12.0f} {:>8.2f}'.format(
+        'serial', baseline, count / baseline, 1.0))
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        elapsed = run(count, chunk_size, workers)
+        print('{:>8} {:>10.3f} {:>12.0f} {:>8.2f}'.format(
+            workers, elapsed, count / elapsed, baseline / elapsed))
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
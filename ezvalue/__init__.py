@@ -6,6 +6,45 @@ it is possible to create a mutable instance of a value object
 when this is required.
 """
 
+import collections.abc
+import operator
+import threading
+import types
+
+
+def _truncate(string, limit):
+    if len(string) <= limit:
+        return string
+    return string[:limit] + '...'
+
+
+_IMMUTABLE_TYPES = frozenset((type(None), bool, int, float, complex, str,
+                              bytes))
+
+
+def _is_immutable(value):
+    # Hashable objects can still change, e.g. mutable value objects, so
+    # only types that are known to be immutable qualify.
+    # pylint: disable = protected-access
+    kind = type(value)
+    if kind in _IMMUTABLE_TYPES:
+        return True
+    if kind is tuple or kind is frozenset:
+        return all(_is_immutable(item) for item in value)
+    if isinstance(value, Value):
+        return value._has_immutable_fields()
+    return False
+
+
+def _prepare_templates(cls):
+    # pylint: disable = protected-access
+    fields = cls._fields
+    cls._str_template = '{}({})'.format(
+        cls.__name__, ','.join(name + '={}' for name in fields))
+    cls._repr_template = '{}({})'.format(
+        cls.__name__, ','.join(name + '={!r}' for name in fields))
+    cls._get_values = staticmethod(ValueMeta._values_getter(fields))
+
 
 class _ValueBase:
     def _is_same_type(self, other, companion_class):
@@ -20,14 +59,22 @@ class _ValueBase:
         return True
 
     def __iter__(self):
-        """Return an iterable with the attribute names."""
-        return iter(self._attributes)
+        """Return an iterable with the attribute names.
+
+        The attributes are returned in definition order, with the
+        attributes of base classes first.
+        """
+        return iter(self._fields)
+
+    def __contains__(self, name):
+        """Return whether name is one of the attribute names."""
+        return name in self._attributes
+
+    _repr_limit = None
 
     def __str__(self):
         """Return a string representation of the object."""
-        attributes = ','.join('{}={}'.format(name, getattr(self, name))
-                              for name in self)
-        return '{}({})'.format(type(self).__name__, attributes)
+        return self._format(self, self._str_template, str)
 
     def __repr__(self):
         """Return a printable representation of the object.
@@ -35,18 +82,35 @@ class _ValueBase:
         Generally when passing this representation to the eval
         function it will return a duplicate of the object, however
         this depends on the values of the attributes.
+
+        The attributes are formatted in definition order using a
+        template that is prepared when the class is created. If the
+        class was defined with a repr_limit, the representations of
+        the attributes are truncated to that many characters, in which
+        case the result can no longer be passed to eval.
         """
-        attributes = ','.join('{}={}'.format(name, repr(getattr(self, name)))
-                              for name in self)
-        return '{}({})'.format(type(self).__name__, attributes)
+        return self._format(self, self._repr_template, repr)
+
+    def _format(self, source, template, convert):
+        values = self._get_values(source)
+        limit = self._repr_limit
+        if limit is None:
+            return template.format(*values)
+        return self._str_template.format(*(_truncate(convert(value), limit)
+                                           for value in values))
+
+    def _field_hashes(self):
+        return tuple(hash(getattr(self, name)) for name in self)
 
     def __hash__(self):
         """Return a hash of the values.
 
-        The hash is computed by putting the values of the attributes
-        in a hash and calculating the hash of that tuple.
+        The hash is computed by putting the hashes of the attribute
+        values in a tuple and calculating the hash of that tuple.
+        Because the hash is built from the individual field hashes it
+        can be updated incrementally when only some attributes change.
         """
-        return hash(tuple(getattr(self, attr) for attr in self))
+        return hash(self._field_hashes())
 
 
 class _MutableValueBase(_ValueBase):
@@ -94,16 +158,54 @@ class _MutableValueBase(_ValueBase):
         not all of the attributes are given, indeed one of the
         purposes of the mutable version of the value object is to
         allow object creation to happen in stages.
+
+        If source is an instance of the complementary Value class
+        (e.g. when created by :meth:`Value.to_mutable`) the source is
+        remembered as the origin of this object. Attributes assigned
+        after that, including those given as keyword arguments, are
+        tracked as changes relative to the origin, see
+        :meth:`changed_attributes`.
         """
+        # pylint: disable = unidiomatic-typecheck
+        self._origin = None
+        self._changed = set()
         if source:
             for name in self._attributes:
                 try:
                     setattr(self, name, getattr(source, name))
                 except AttributeError:
                     pass
+            if type(source) is self.Immutable:
+                self._origin = source
+                self._changed.clear()
         for name, value in kwargs.items():
             setattr(self, name, value)
 
+    def __setattr__(self, name, value):
+        """Set the attribute and record it as changed."""
+        super().__setattr__(name, value)
+        if name in self._attributes:
+            self._changed.add(name)
+
+    def __delattr__(self, name):
+        """Delete the attribute and record it as changed."""
+        super().__delattr__(name)
+        if name in self._attributes:
+            self._changed.add(name)
+
+    def changed_attributes(self):
+        """Return the names of the attributes that have been changed.
+
+        For an object created from an instance of the complementary
+        Value class these are the attributes that have been assigned
+        or deleted since it was created. For any other object these
+        are all the attributes that have been assigned. Assigning an
+        attribute counts as a change even if the new value is equal
+        to the old one. Extra attributes that are not part of the
+        Value's definition are never included.
+        """
+        return frozenset(self._changed)
+
     def to_immutable(self):
         """Create an immutable value object from this mutable instance.
 
@@ -112,8 +214,32 @@ class _MutableValueBase(_ValueBase):
         of returning an immutable version of the object. Keep in mind
         that any assigned attributes that are not part of the Value's
         definition will not be part of the returned object.
+
+        If this object was created from an instance of the Value class
+        the result is derived from that origin instead: when nothing
+        has changed the origin itself is returned, otherwise only the
+        changed attributes are copied into a clone of the origin.
         """
-        return self.Immutable(self)
+        # pylint: disable = protected-access
+        origin = self._origin
+        if origin is None or not origin._has_default_init():
+            return self.Immutable(self)
+        if not self._changed:
+            return origin
+        return origin._evolve({name: getattr(self, name)
+                               for name in self._changed})
+
+    def _field_hashes(self):
+        # pylint: disable = protected-access
+        origin = self._origin
+        if origin is None:
+            return super()._field_hashes()
+        hashes = origin._field_hashes()
+        changed = self._changed
+        if not changed:
+            return hashes
+        return tuple(hash(getattr(self, name)) if name in changed else value
+                     for name, value in zip(self, hashes))
 
     def __eq__(self, other):
         """Test equality to another value object instance.
@@ -125,12 +251,274 @@ class _MutableValueBase(_ValueBase):
 
         An instance of a mutable value object is never equal to any
         other type, even if the attributes are the same.
+
+        When compared to the Value instance it was created from only
+        the changed attributes are compared.
         """
-        return self._is_equal(other, self.Immutable)
+        origin = self._origin
+        if origin is not None and other is origin:
+            for name in self._changed:
+                if getattr(self, name) != getattr(origin, name):
+                    return False
+            return True
+        immutable = self.Immutable
+        return self._is_equal(other, (immutable, immutable._View))
 
     __hash__ = _ValueBase.__hash__
 
 
+class _ConcurrentMutableValueBase(_MutableValueBase):
+    """Base class for the thread-safe mutable version of a value.
+
+    This is the base class for the concurrent mutable versions of
+    value objects and is not meant to be instantiated directly. When
+    defining a new value object the ConcurrentMutable attribute is
+    automatically set to a newly created subclass of this class and of
+    the Mutable class.
+
+    A concurrent mutable value object behaves like a normal mutable
+    value object, but the attributes of the Value's definition are
+    kept in a dict that is never modified once it is published.
+    Assigning attributes replaces the dict with an updated copy while
+    holding a lock that is only shared with other writers. Readers
+    never take the lock, so they never block writers and always see
+    a consistent set of attributes.
+
+    Use :meth:`update` to change several attributes atomically and
+    :meth:`snapshot` or :meth:`to_immutable
+    <_MutableValueBase.to_immutable>` to get a consistent copy.
+    Attributes that are not part of the Value's definition are stored
+    as normal attributes and are not protected.
+    """
+
+    def __init__(self, source=None, **kwargs):
+        """Create from a source object and/or keyword arguments.
+
+        See :meth:`_MutableValueBase.__init__`.
+        """
+        # pylint: disable=super-init-not-called,unidiomatic-typecheck
+        state = {}
+        origin = None
+        if source:
+            for name in self._attributes:
+                try:
+                    state[name] = getattr(source, name)
+                except AttributeError:
+                    pass
+            if type(source) is self.Immutable:
+                origin = source
+        changed = frozenset() if origin else frozenset(state)
+        self.__dict__.update(_origin=origin, _lock=threading.Lock(),
+                             _published=(state, changed))
+        self.update(**kwargs)
+
+    def __getattr__(self, name):
+        """Return an attribute from the published state."""
+        if not name.startswith('_'):
+            try:
+                return self.__dict__['_published'][0][name]
+            except KeyError:
+                pass
+        raise AttributeError("'{}' object has no attribute '{}'"
+                             .format(type(self).__name__, name))
+
+    def __setattr__(self, name, value):
+        """Set the attribute, see :meth:`update`."""
+        self.update(**{name: value})
+
+    def __delattr__(self, name):
+        """Delete the attribute and record it as changed."""
+        if name not in self._attributes:
+            object.__delattr__(self, name)
+            return
+        with self._lock:
+            state, changed = self._published
+            if name not in state:
+                raise AttributeError(name)
+            state = dict(state)
+            del state[name]
+            self.__dict__['_published'] = (state, changed | {name})
+
+    def update(self, **kwargs):
+        """Assign several attributes atomically.
+
+        Readers see either none or all of the assignments. Keywords
+        that are not part of the Value's definition are assigned as
+        normal attributes.
+        """
+        updates = {}
+        for name, value in kwargs.items():
+            if name in self._attributes:
+                updates[name] = value
+            else:
+                object.__setattr__(self, name, value)
+        if not updates:
+            return
+        with self._lock:
+            state, changed = self._published
+            state = dict(state)
+            state.update(updates)
+            self.__dict__['_published'] = (state, changed.union(updates))
+
+    def changed_attributes(self):
+        """Return the names of the attributes that have been changed.
+
+        See :meth:`_MutableValueBase.changed_attributes`.
+        """
+        return self._published[1]
+
+    def snapshot(self):
+        """Return a consistent read-only view of the current attributes.
+
+        The snapshot is a view as returned by :meth:`Value.view` on
+        the currently published attributes, so creating it does not
+        copy anything. Later changes do not affect the snapshot.
+        """
+        return self.Immutable.view(types.MappingProxyType(
+            self._published[0]))
+
+    def to_immutable(self):
+        """Create an immutable value object from a consistent snapshot.
+
+        See :meth:`_MutableValueBase.to_immutable`.
+        """
+        # pylint: disable = protected-access
+        state, changed = self._published
+        origin = self._origin
+        if origin is None or not origin._has_default_init():
+            return self.Immutable(self.Immutable.view(state))
+        if not changed:
+            return origin
+        try:
+            return origin._evolve({name: state[name] for name in changed})
+        except KeyError as error:
+            raise AttributeError("Attribute '{}' not specified."
+                                 .format(error.args[0])) from error
+
+    def _field_hashes(self):
+        # pylint: disable = protected-access
+        return self.snapshot()._field_hashes()
+
+    def __eq__(self, other):
+        """Test equality to another value object using a snapshot.
+
+        See :meth:`_MutableValueBase.__eq__`.
+        """
+        if isinstance(other, _ConcurrentMutableValueBase):
+            other = other.snapshot()
+        return self.snapshot() == other
+
+    __hash__ = _ValueBase.__hash__
+
+    def __str__(self):
+        """Return a string representation of a snapshot."""
+        return self._format(self.snapshot(), self._str_template, str)
+
+    def __repr__(self):
+        """Return a printable representation of a snapshot."""
+        return self._format(self.snapshot(), self._repr_template, repr)
+
+
+class _ValueView(_ValueBase):
+    """Base class for read-only views of a value.
+
+    This is the base class for lazy views on a source object and is
+    not meant to be instantiated directly. Use :meth:`Value.view` to
+    create a view.
+
+    A view behaves like an instance of the Value class it was created
+    for, however the attributes are only fetched from the source
+    object when they are first accessed. Fetched attributes are cached
+    in the view, so every attribute is read from the source at most
+    once. Note that this means that changes to the source object are
+    only reflected in the view if the attribute was not yet accessed.
+    """
+
+    def __init__(self, source):
+        """Create a view on source.
+
+        The source can be a mapping, in which case the attributes are
+        looked up as keys, or any other object, in which case the
+        attributes are looked up as attributes. Missing attributes
+        only raise an AttributeError when they are accessed.
+        """
+        object.__setattr__(self, '_source', source)
+        object.__setattr__(self, '_is_mapping',
+                           isinstance(source, collections.abc.Mapping))
+
+    def __getattr__(self, name):
+        """Fetch an attribute from the source and cache it."""
+        if name.startswith('_') or name not in self._attributes:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'"
+                .format(type(self).__name__, name))
+        if self._is_mapping:
+            try:
+                value = self._source[name]
+            except KeyError as error:
+                raise AttributeError("Attribute '{}' not in source."
+                                     .format(name)) from error
+        else:
+            value = getattr(self._source, name)
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        """Raise AttributeError because the view is read-only."""
+        raise AttributeError('Object is immutable.')
+
+    def __delattr__(self, name):
+        """Raise AttributeError because the view is read-only."""
+        raise AttributeError('Object is immutable.')
+
+    def __getstate__(self):
+        """Return the state for pickling without the cached hash.
+
+        See :meth:`Value.__getstate__`.
+        """
+        state = dict(self.__dict__)
+        state.pop('_hash', None)
+        return state
+
+    def materialize(self):
+        """Return an instance of the Value class with the same values.
+
+        All attributes that were not accessed yet are fetched from the
+        source.
+        """
+        return self.Immutable(self)
+
+    def __eq__(self, other):
+        """Test equality to another value object instance.
+
+        A view is equal to instances of the Value class it was created
+        for, to instances of its mutable companion class and to other
+        views of the same class if and only if all attributes compare
+        equal. Concurrent mutable objects are compared using a
+        consistent snapshot.
+        """
+        if isinstance(other, _ConcurrentMutableValueBase):
+            other = other.snapshot()
+        immutable = self.Immutable
+        return self._is_equal(other, (immutable, immutable.Mutable))
+
+    def __hash__(self):
+        """Return a hash of the values.
+
+        The hash is equal to the hash of the corresponding instance of
+        the Value class. Like for a value object it is computed only
+        once if all attributes are immutable.
+        """
+        try:
+            return self.__dict__['_hash']
+        except KeyError:
+            value = hash(self._field_hashes())
+            state = self.__dict__
+            if all(_is_immutable(state[name]) for name in self):
+                state['_hash'] = value
+            return value
+
+
 class ValueMeta(type):
     """Meta class for creating value objects.
 
@@ -142,27 +530,104 @@ class ValueMeta(type):
     must make sure their meta class inherits from this class.
     """
 
-    def __init__(cls, name, bases, namespace):
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        """Create the class, see :meth:`__init__` for the keywords."""
+        # pylint: disable = unused-argument
+        return super().__new__(mcs, name, bases, namespace)
+
+    def __init__(cls, name, bases, namespace, repr_limit=None):
         """Initialize the class.
 
         Set the list of attributes and generate a mutable
-        companion class.
+        companion class. Besides the set of attributes the attribute
+        names are also stored in definition order, with the attributes
+        of base classes first.
+
+        The companion classes of a subclass of a value class are
+        subclasses of the companion classes of its base, e.g.
+        ``Child.Mutable`` is a subclass of ``Parent.Mutable``.
+
+        The repr_limit keyword can be given in the class definition to
+        truncate the representations of the attributes in the string
+        representations of the object, e.g.
+        ``class Foo(Value, repr_limit=80)``. It is inherited by
+        subclasses.
         """
-        # pylint: disable = protected-access
+        # pylint: disable = protected-access, no-value-for-parameter
         super().__init__(name, bases, namespace)
-        attributes = {name for name in dir(cls)
-                      if not name.startswith('_') and
-                      not callable(getattr(cls, name))}
-        attributes -= {'Mutable', 'to_mutable'}
-        cls._attributes = attributes
-
-        class SubclassedMutable(_MutableValueBase):
-            pass
-
-        cls.Mutable = SubclassedMutable
-        cls.Mutable.__name__ = 'Mutable' + name
-        cls.Mutable.Immutable = cls
-        cls.Mutable._attributes = attributes
+        cls._fields = tuple(name for name in cls._candidate_fields(bases)
+                            if not callable(getattr(cls, name)))
+        cls._attributes = frozenset(cls._fields)
+        if repr_limit is not None:
+            cls._repr_limit = repr_limit
+        _prepare_templates(cls)
+        value_bases = [base for base in bases if isinstance(base, ValueMeta)]
+        mutable_bases = tuple(base.Mutable for base in value_bases) or \
+            (_MutableValueBase,)
+        concurrent_bases = tuple(base.ConcurrentMutable
+                                 for base in value_bases) or \
+            (_ConcurrentMutableValueBase,)
+        view_bases = tuple(base._View for base in value_bases) or \
+            (_ValueView,)
+
+        mutable = type('SubclassedMutable', mutable_bases, {})
+        cls._add_companion('Mutable', mutable)
+        concurrent = type('SubclassedConcurrentMutable',
+                          concurrent_bases + (mutable,), {})
+        cls._add_companion('ConcurrentMutable', concurrent)
+        cls._add_companion('_View', type('SubclassedView', view_bases, {}))
+
+    def _candidate_fields(cls, bases):
+        """Return the names that may be attributes in definition order.
+
+        The attributes of base value classes are taken from their
+        cached fields, only other base classes and the new class
+        itself have to be scanned.
+        """
+        # pylint: disable = protected-access
+        names = []
+        for base in reversed(bases):
+            if isinstance(base, ValueMeta):
+                names.extend(base._fields)
+            else:
+                for klass in reversed(base.__mro__):
+                    names.extend(vars(klass))
+        names.extend(vars(cls))
+        seen = set()
+        for name in names:
+            if name in seen or name.startswith('_') or \
+                    name in ('Mutable', 'to_mutable'):
+                continue
+            seen.add(name)
+            yield name
+
+    @staticmethod
+    def _values_getter(keys, make_getter=operator.attrgetter):
+        """Return a function that returns a tuple with the keys' values.
+
+        Unlike the getters from the operator module the function always
+        returns a tuple, also for a single key. It is available on every
+        value class, so that other modules do not have to import this
+        module.
+        """
+        if not keys:
+            return lambda obj: ()
+        if len(keys) == 1:
+            get_value = make_getter(keys[0])
+            return lambda obj: (get_value(obj),)
+        return make_getter(*keys)
+
+    def _add_companion(cls, attribute, companion):
+        # pylint: disable = protected-access
+        setattr(cls, attribute, companion)
+        companion.__name__ = attribute.lstrip('_') + cls.__name__
+        companion.__module__ = cls.__module__
+        companion.__qualname__ = cls.__qualname__ + '.' + attribute
+        companion.Immutable = cls
+        companion._attributes = cls._attributes
+        companion._fields = cls._fields
+        companion._repr_limit = cls._repr_limit
+        _prepare_templates(companion)
 
 
 class Value(_ValueBase, metaclass=ValueMeta):
@@ -178,7 +643,9 @@ class Value(_ValueBase, metaclass=ValueMeta):
     in the subclass body. The value of the attributes should be a
     docstring describing the attribute. Valid attribute names are
     any valid python variable name not starting with an underscore
-    except 'Mutable', 'to_mutable', 'Immutable' and 'to_immutable'.
+    except 'Mutable', 'ConcurrentMutable', 'to_mutable', 'Immutable',
+    'to_immutable', 'update', 'snapshot', 'changed_attributes', 'view',
+    'materialize', 'read_csv' and 'write_csv'.
 
     Example::
 
@@ -232,6 +699,47 @@ class Value(_ValueBase, metaclass=ValueMeta):
                                      .format(name))
             setattr(self, name, value)
 
+    @classmethod
+    def view(cls, source):
+        """Return a lazy read-only view on source.
+
+        Unlike the constructor, which copies all attributes from the
+        source object, the view only fetches attributes when they are
+        accessed. The source can be a mapping or any object with the
+        attributes. The view supports iteration, equality, hashing and
+        string representations like a value object and can be turned
+        into a real value object with its materialize method.
+
+        >>> class MyValueObject(Value): foo = 'Test attribute'
+        ...
+        >>> view = MyValueObject.view({'foo': 1})
+        >>> view.foo
+        1
+        >>> view == MyValueObject(foo=1)
+        True
+        >>> view.materialize()
+        MyValueObject(foo=1)
+        """
+        return cls._View(source)
+
+    @classmethod
+    def read_csv(cls, file, converters=None, **fmtparams):
+        """Return an iterator over value objects read from a CSV file.
+
+        See :func:`ezvalue.csvio.read_csv`.
+        """
+        from ezvalue import csvio
+        return csvio.read_csv(cls, file, converters, **fmtparams)
+
+    @classmethod
+    def write_csv(cls, values, file, **fmtparams):
+        """Write value objects to a CSV file.
+
+        See :func:`ezvalue.csvio.write_csv`.
+        """
+        from ezvalue import csvio
+        csvio.write_csv(cls, values, file, **fmtparams)
+
     def to_mutable(self):
         """Return a mutable copy of the value object.
 
@@ -261,9 +769,125 @@ class Value(_ValueBase, metaclass=ValueMeta):
         >>> my_value == MyValueObject(MyNamedTuple(foo=1))
         True
         """
-        return self._is_equal(other, self.Mutable)
+        # pylint: disable = unidiomatic-typecheck, protected-access
+        if isinstance(other, _ConcurrentMutableValueBase):
+            other = other.snapshot()
+        if type(other) is type(self):
+            own_hash = self.__dict__.get('_hash')
+            other_hash = other.__dict__.get('_hash')
+            if own_hash is not None and other_hash is not None and \
+                    own_hash != other_hash:
+                return False
+        elif type(other) is self.Mutable and other._origin is self:
+            return other == self
+        return self._is_equal(other, (self.Mutable, self._View))
 
-    __hash__ = _ValueBase.__hash__
+    def __hash__(self):
+        """Return a hash of the values.
+
+        See :meth:`_ValueBase.__hash__`. If all attributes are
+        immutable, e.g. strings, numbers or other value objects, the
+        hash is computed only once and cached.
+        """
+        try:
+            return self.__dict__['_hash']
+        except KeyError:
+            value = hash(self._field_hashes())
+            if '_hashes' in self.__dict__:
+                self.__dict__['_hash'] = value
+            return value
+
+    def __str__(self):
+        """Return a string representation of the object.
+
+        The result is computed only once and cached if all attributes
+        are immutable, see :meth:`__hash__`. Otherwise it is formatted
+        on every call since the attributes may still change.
+        """
+        try:
+            return self.__dict__['_str']
+        except KeyError:
+            string = super().__str__()
+            if self._has_immutable_fields():
+                self.__dict__['_str'] = string
+            return string
+
+    def __repr__(self):
+        """Return a printable representation of the object.
+
+        See :meth:`_ValueBase.__repr__`. Like :meth:`__str__` the result
+        is cached if all attributes are immutable, representations of
+        nested value objects are therefore also reused.
+        """
+        try:
+            return self.__dict__['_repr']
+        except KeyError:
+            string = super().__repr__()
+            if self._has_immutable_fields():
+                self.__dict__['_repr'] = string
+            return string
+
+    def __getstate__(self):
+        """Return the state for pickling without the cached hashes.
+
+        Hashes of for example strings differ between processes, so
+        the cached hashes must not be restored in another process.
+        """
+        return {name: self.__dict__[name] for name in self}
+
+    def _field_hashes(self):
+        try:
+            return self.__dict__['_hashes']
+        except KeyError:
+            hashes = super()._field_hashes()
+            if self._has_immutable_fields():
+                self.__dict__['_hashes'] = hashes
+            return hashes
+
+    def _has_immutable_fields(self):
+        if '_hashes' in self.__dict__:
+            return True
+        state = self.__dict__
+        return all(_is_immutable(state[name]) for name in self)
+
+    @classmethod
+    def _from_fields(cls, fields, values):
+        """Create an instance from attribute names and values.
+
+        The constructor is bypassed, so this must only be used with
+        values that were taken from a valid instance of this class.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(zip(fields, values))
+        return instance
+
+    @classmethod
+    def _has_default_init(cls):
+        return cls.__init__ is Value.__init__ and \
+            cls.__setattr__ is Value.__setattr__
+
+    def _evolve(self, changes):
+        """Return a copy of this object with some attributes replaced.
+
+        The attributes that are not in changes are shared with this
+        object without going through the constructor. If the field
+        hashes of this object are cached and the changed attributes are
+        immutable, the hashes of the copy are derived from them by
+        hashing only the changed attributes.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        state = clone.__dict__
+        for name in self:
+            state[name] = self.__dict__[name]
+        state.update(changes)
+        hashes = self.__dict__.get('_hashes')
+        if hashes is not None and all(_is_immutable(value)
+                                      for value in changes.values()):
+            state['_hashes'] = tuple(
+                hash(changes[name]) if name in changes else value
+                for name, value in zip(self, hashes))
+        return clone
 
     def __setattr__(self, name, value):
         """Raise AttributeError because object is immutable."""
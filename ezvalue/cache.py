@@ -0,0 +1,265 @@
+"""Persistent memoization keyed by value objects.
+
+Immutable value objects make excellent cache keys. This module
+provides the :class:`PersistentCache` class, an in-memory LRU cache
+backed by a SQLite database so the cached results survive a restart
+of the process, and the :func:`memoize` decorator which caches the
+results of a function in such a cache.
+
+Python's built-in hash of for example strings is randomized per
+process, so the cache keys are instead derived from a deterministic
+serialization of the arguments, see :func:`stable_key`.
+
+Example::
+
+    @memoize(path='prices.sqlite', ttl=3600)
+    def price(instrument):
+        return expensive_computation(instrument)
+"""
+
+import collections
+import functools
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+
+import ezvalue
+
+
+_MISSING = object()
+
+
+class CacheStats(ezvalue.Value):
+    """Statistics of a cache."""
+
+    hits = """The total number of hits."""
+    misses = """The number of lookups that were not found."""
+    memory_hits = """The number of hits in the memory tier."""
+    disk_hits = """The number of hits in the disk tier."""
+    evictions = """The number of entries evicted from the disk tier."""
+
+
+def stable_key(obj):
+    """Return a deterministic key for obj as a hex string.
+
+    Unlike the built-in hash function the key is the same in every
+    process. Value objects are serialized by their class name and their
+    attributes sorted by name, so the key does not depend on the order
+    of the attributes. Other supported types are None, booleans,
+    numbers, strings, bytes and tuples, lists, sets and dicts thereof.
+    A TypeError is raised for any other type.
+    """
+    return hashlib.sha256(_serialize(obj)).hexdigest()
+
+
+def _serialize(obj):
+    # pylint: disable=too-many-return-statements
+    if isinstance(obj, ezvalue.Value):
+        cls = type(obj)
+        name = '{}.{}'.format(cls.__module__, cls.__qualname__)
+        fields = b''.join(_serialize(attribute) +
+                          _serialize(getattr(obj, attribute))
+                          for attribute in sorted(obj))
+        return _frame(b'V', _serialize(name) + fields)
+    if obj is None or isinstance(obj, (bool, int, float, complex)):
+        return _frame(type(obj).__name__.encode(), repr(obj).encode())
+    if isinstance(obj, str):
+        return _frame(b's', obj.encode('utf-8', 'surrogatepass'))
+    if isinstance(obj, bytes):
+        return _frame(b'b', obj)
+    if isinstance(obj, (tuple, list)):
+        return _frame(b't' if isinstance(obj, tuple) else b'l',
+                      b''.join(_serialize(item) for item in obj))
+    if isinstance(obj, (set, frozenset)):
+        return _frame(b'S', b''.join(sorted(_serialize(item)
+                                            for item in obj)))
+    if isinstance(obj, dict):
+        return _frame(b'd', b''.join(sorted(_serialize(key) +
+                                            _serialize(value)
+                                            for key, value in obj.items())))
+    raise TypeError("Cannot derive a stable key from type '{}'."
+                    .format(type(obj).__name__))
+
+
+def _frame(tag, data):
+    return tag + b':' + str(len(data)).encode() + b':' + data
+
+
+class PersistentCache:
+    """A two tier cache with an in-memory LRU tier and a SQLite tier.
+
+    If path is None only the memory tier is used. The memory tier holds
+    at most maxsize entries, the least recently used entries are
+    dropped first. The disk tier holds at most max_entries entries if
+    given, evicting the least recently accessed entries. If ttl is
+    given, entries older than ttl seconds are treated as missing and
+    do not count towards max_entries.
+
+    Keys may be any object supported by :func:`stable_key`. Cached
+    values are pickled when they are stored on disk.
+
+    The cache can be shared between threads.
+    """
+
+    def __init__(self, path=None, maxsize=1024, ttl=None, max_entries=None):
+        """Create a cache, see the class documentation."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._counts = collections.Counter()
+        self._connection = None
+        if path is not None:
+            self._connection = sqlite3.connect(
+                path, isolation_level=None, check_same_thread=False)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, value BLOB, '
+                'created REAL, accessed REAL)')
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS entries_accessed '
+                'ON entries (accessed)')
+
+    def get(self, key, default=None):
+        """Return the cached value for key or default if not cached."""
+        return self._get(stable_key(key), default)
+
+    def set(self, key, value):
+        """Store value in the cache under key."""
+        self._set(stable_key(key), value)
+
+    def _get(self, digest, default):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(digest)
+            if entry is not None:
+                value, created = entry
+                if not self._expired(created, now):
+                    self._memory.move_to_end(digest)
+                    self._counts['memory_hits'] += 1
+                    return value
+                del self._memory[digest]
+            value = self._get_from_disk(digest, now)
+            if value is _MISSING:
+                self._counts['misses'] += 1
+                return default
+            self._counts['disk_hits'] += 1
+            return value
+
+    def _set(self, digest, value):
+        now = time.time()
+        with self._lock:
+            self._remember(digest, value, now)
+            if self._connection is not None:
+                self._store(digest, value, now)
+
+    def clear(self):
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._connection is not None:
+                self._connection.execute('DELETE FROM entries')
+
+    def stats(self):
+        """Return a :class:`CacheStats` object with the statistics."""
+        with self._lock:
+            counts = self._counts
+            return CacheStats(
+                hits=counts['memory_hits'] + counts['disk_hits'],
+                misses=counts['misses'],
+                memory_hits=counts['memory_hits'],
+                disk_hits=counts['disk_hits'],
+                evictions=counts['evictions'])
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __len__(self):
+        """Return the number of entries in the memory tier."""
+        return len(self._memory)
+
+    def _expired(self, created, now):
+        return self.ttl is not None and now - created > self.ttl
+
+    def _remember(self, digest, value, created):
+        self._memory[digest] = (value, created)
+        self._memory.move_to_end(digest)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _get_from_disk(self, digest, now):
+        if self._connection is None:
+            return _MISSING
+        row = self._connection.execute(
+            'SELECT value, created FROM entries WHERE key = ?',
+            (digest,)).fetchone()
+        if row is None:
+            return _MISSING
+        data, created = row
+        if self._expired(created, now):
+            self._connection.execute('DELETE FROM entries WHERE key = ?',
+                                     (digest,))
+            return _MISSING
+        self._connection.execute(
+            'UPDATE entries SET accessed = ? WHERE key = ?', (now, digest))
+        value = pickle.loads(data)
+        self._remember(digest, value, created)
+        return value
+
+    def _store(self, digest, value, now):
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        self._connection.execute(
+            'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+            (digest, data, now, now))
+        if self.max_entries is not None:
+            self._evict(now)
+
+    def _evict(self, now):
+        # The database may be shared with other processes, so the
+        # entries that are kept are determined by the database itself.
+        if self.ttl is not None:
+            self._connection.execute('DELETE FROM entries WHERE created < ?',
+                                     (now - self.ttl,))
+        cursor = self._connection.execute(
+            'DELETE FROM entries WHERE key IN (SELECT key FROM entries '
+            'ORDER BY accessed DESC LIMIT -1 OFFSET ?)', (self.max_entries,))
+        self._counts['evictions'] += max(cursor.rowcount, 0)
+
+
+def memoize(cache=None, **options):
+    """Return a decorator that caches the results of a function.
+
+    The results are stored in cache, or if cache is None in a new
+    :class:`PersistentCache` created with the given keyword options.
+    The cache key consists of the module and name of the function and
+    the arguments, so a single cache can be shared by several
+    functions. The cache is available as the cache attribute of the
+    decorated function.
+    """
+    if cache is None:
+        cache = PersistentCache(**options)
+
+    def decorator(function):
+        name = '{}.{}'.format(function.__module__, function.__qualname__)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # pylint: disable=protected-access
+            digest = stable_key((name, args, kwargs))
+            result = cache._get(digest, _MISSING)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache._set(digest, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,145 @@
+"""Operations on collections of value objects.
+
+This module provides deduplication, grouping, counting and simple
+aggregation of value objects keyed on a subset of their attributes.
+
+All functions accept either an iterable of value objects or a columnar
+mapping of attribute names to equally long sequences, e.g.
+``{'x': [1, 2], 'y': [3, 4]}``. For value objects the keys are
+extracted with :func:`operator.attrgetter` and whole value objects are
+hashed using their cached hash. For columns the keys are built by
+zipping the columns, so no objects are created per row.
+
+When a single field is given the keys are the attribute values
+themselves, when multiple fields are given the keys are tuples of the
+attribute values in the order the fields were given.
+
+For example:
+
+>>> import ezvalue
+>>> class Point(ezvalue.Value):
+...     x = 'The x-coordinate.'
+...     y = 'The y-coordinate.'
+...
+>>> points = [Point(x=1, y=2), Point(x=1, y=3), Point(x=3, y=2)]
+>>> count_by(points, 'x')
+Counter({1: 2, 3: 1})
+>>> [point.y for point in unique(points, 'x')]
+[2, 2]
+>>> count_by({'x': [1, 1, 3], 'y': [2, 3, 2]}, 'y')
+Counter({2: 2, 3: 1})
+"""
+
+import collections
+import collections.abc
+import operator
+
+
+def unique(values, *fields):
+    """Return an iterator over values with duplicates removed.
+
+    Without fields whole value objects are compared, otherwise two
+    values are considered duplicates if the given fields are equal.
+    Only the first occurrence of every value is returned and the order
+    is preserved. Only the unique values (or keys) are kept in memory
+    so the input can be a stream.
+
+    For columnar input an iterator over the indices of the unique rows
+    is returned, without fields all columns are compared.
+    """
+    if _is_columnar(values):
+        keys = _column_keys(values, fields or tuple(values))
+        return (index for index, key in _unique(enumerate(keys)))
+    if not fields:
+        return (value for value, _ in _unique((value, value)
+                                              for value in values))
+    key = operator.attrgetter(*fields)
+    return (value for value, _ in _unique((value, key(value))
+                                          for value in values))
+
+
+def group_by(values, *fields):
+    """Group values on the given fields.
+
+    Return a dict mapping every key to a list of the values with that
+    key, in input order. For columnar input the lists contain row
+    indices instead of values.
+    """
+    groups = collections.OrderedDict()
+    for item, key in _keyed(values, fields):
+        try:
+            groups[key].append(item)
+        except KeyError:
+            groups[key] = [item]
+    return groups
+
+
+def count_by(values, *fields):
+    """Return a Counter with the number of values for every key."""
+    if _is_columnar(values):
+        return collections.Counter(_column_keys(values, fields))
+    _check_fields(fields)
+    return collections.Counter(map(operator.attrgetter(*fields), values))
+
+
+def aggregate(values, fields, target, function):
+    """Aggregate an attribute per group.
+
+    The values are grouped on the fields, which is either a single
+    attribute name or a sequence of names, and function is called with
+    a list of the target attribute values of every group. Return a dict
+    mapping every key to the result, for example to compute the total
+    amount per account::
+
+        totals = aggregate(transactions, 'account', 'amount', sum)
+    """
+    if isinstance(fields, str):
+        fields = (fields,)
+    groups = collections.OrderedDict()
+    if _is_columnar(values):
+        items = zip(values[target], _column_keys(values, fields))
+    else:
+        _check_fields(fields)
+        get_target = operator.attrgetter(target)
+        get_key = operator.attrgetter(*fields)
+        items = ((get_target(value), get_key(value)) for value in values)
+    for item, key in items:
+        try:
+            groups[key].append(item)
+        except KeyError:
+            groups[key] = [item]
+    return collections.OrderedDict((key, function(group))
+                                   for key, group in groups.items())
+
+
+def _unique(items):
+    seen = set()
+    add = seen.add
+    for item, key in items:
+        if key not in seen:
+            add(key)
+            yield item, key
+
+
+def _keyed(values, fields):
+    if _is_columnar(values):
+        return enumerate(_column_keys(values, fields))
+    _check_fields(fields)
+    key = operator.attrgetter(*fields)
+    return ((value, key(value)) for value in values)
+
+
+def _is_columnar(values):
+    return isinstance(values, collections.abc.Mapping)
+
+
+def _column_keys(columns, fields):
+    _check_fields(fields)
+    if len(fields) == 1:
+        return iter(columns[fields[0]])
+    return zip(*(columns[name] for name in fields))
+
+
+def _check_fields(fields):
+    if not fields:
+        raise TypeError('At least one field must be given.')
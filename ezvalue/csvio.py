@@ -0,0 +1,141 @@
+"""Reading and writing value objects from and to CSV files.
+
+The functions in this module are also available as the
+:meth:`read_csv <ezvalue.Value.read_csv>` and
+:meth:`write_csv <ezvalue.Value.write_csv>` class methods of every
+value object.
+
+The header of a file is mapped to the attributes of the value object
+only once, after which every row is turned into a value object without
+any further lookups by name. The reader is a generator, so files of any
+size can be processed in constant memory.
+
+Example::
+
+    for point in Point.read_csv('points.csv', converters={'x': float}):
+        ...
+    Point.write_csv(points, 'points.csv')
+"""
+
+import csv
+import operator
+import os
+
+
+def read_csv(value_class, file, converters=None, **fmtparams):
+    """Return an iterator over value objects read from a CSV file.
+
+    The file may be a path or an open text file, which should have been
+    opened with newline=''. The first row must be a header containing
+    a column for every attribute of value_class, extra columns are
+    ignored. The fmtparams are passed on to :func:`csv.reader`.
+
+    By default the attributes are strings, converters can be a dict
+    mapping attribute names to functions that are called with the
+    string to convert it, e.g. ``{'x': float}``.
+
+    Blank lines are skipped, like :class:`csv.DictReader` does.
+
+    If the file is invalid, a converter raises an exception or the
+    value object can not be created a ValueError is raised that
+    contains the line number.
+    """
+    # pylint: disable=protected-access
+    converters = dict(converters or {})
+    unknown = set(converters) - value_class._attributes
+    if unknown:
+        raise ValueError('Converters for unknown attributes: {}.'
+                         .format(', '.join(sorted(unknown))))
+    if isinstance(file, (str, bytes, os.PathLike)):
+        return _read_path(value_class, file, converters, fmtparams)
+    return _read(value_class, file, converters, fmtparams)
+
+
+def write_csv(value_class, values, file, header=True, **fmtparams):
+    """Write value objects to a CSV file.
+
+    The file may be a path or an open text file, which should have been
+    opened with newline=''. The columns are written in the order in
+    which the attributes are defined, preceded by a header row unless
+    header is false. The fmtparams are passed on to :func:`csv.writer`.
+    """
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, 'w', newline='') as opened_file:
+            _write(value_class, values, opened_file, header, fmtparams)
+    else:
+        _write(value_class, values, file, header, fmtparams)
+
+
+def _read_path(value_class, path, converters, fmtparams):
+    with open(path, newline='') as file:
+        for value in _read(value_class, file, converters, fmtparams):
+            yield value
+
+
+def _read(value_class, file, converters, fmtparams):
+    # pylint: disable=protected-access
+    fields = value_class._fields
+    reader = csv.reader(file, **fmtparams)
+    rows = _rows(reader)
+    try:
+        header = next(rows)
+    except StopIteration:
+        raise ValueError('CSV file has no header.') from None
+    missing = [name for name in fields if name not in header]
+    if missing:
+        raise ValueError('Line {}: missing columns: {}.'
+                         .format(reader.line_num, ', '.join(missing)))
+    get_values = value_class._values_getter(
+        [header.index(name) for name in fields], operator.itemgetter)
+    conversions = [(index, converters[name])
+                   for index, name in enumerate(fields)
+                   if name in converters]
+    if value_class._has_default_init():
+        create = value_class._from_fields
+    else:
+        def create(fields, row):
+            return value_class(**dict(zip(fields, row)))
+    width = len(header)
+    for row in rows:
+        try:
+            if len(row) != width:
+                raise ValueError('expected {} columns, found {}'
+                                 .format(width, len(row)))
+            row = get_values(row)
+            if conversions:
+                row = _convert(row, conversions)
+            yield create(fields, row)
+        except Exception as error:  # pylint: disable=broad-except
+            raise ValueError('Line {}: {}'.format(reader.line_num, error)) \
+                from error
+
+
+def _rows(reader):
+    # Blank lines are skipped and errors of the reader itself, e.g. for
+    # invalid quoting, get the line number like all other errors.
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as error:
+            raise ValueError('Line {}: {}'.format(reader.line_num, error)) \
+                from error
+        if row:
+            yield row
+
+
+def _convert(row, conversions):
+    row = list(row)
+    for index, convert in conversions:
+        row[index] = convert(row[index])
+    return row
+
+
+def _write(value_class, values, file, header, fmtparams):
+    # pylint: disable=protected-access
+    fields = value_class._fields
+    writer = csv.writer(file, **fmtparams)
+    if header:
+        writer.writerow(fields)
+    writer.writerows(map(value_class._get_values, values))
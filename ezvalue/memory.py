@@ -0,0 +1,163 @@
+"""Memory footprint reporting for value objects.
+
+This module helps finding out how much memory value objects use. The
+:func:`deep_size` function measures a single object including
+everything it refers to, :func:`instance_size` estimates the fixed cost
+of an instance of a value class and :func:`track` enables counting the
+live instances of value classes, which can be reported with
+:func:`report` and :func:`format_report`.
+
+Example::
+
+    memory.track(Point)
+    ...
+    print(memory.format_report())
+
+Tracking does not change the tracked classes, so creating value
+objects does not cost anything extra. Instead the live instances are
+looked up through the garbage collector when a report is made.
+"""
+
+import gc
+import sys
+import types
+
+import ezvalue
+
+
+_tracked = set()
+
+_NOT_TRAVERSED = (type, types.ModuleType, types.FunctionType,
+                  types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_size(obj, seen=None):
+    """Return the size of obj in bytes including the objects it refers to.
+
+    The instance dict of objects and the contents of lists, tuples,
+    sets and dicts are followed. Classes, modules and functions are
+    neither counted nor followed. Every object is counted only once,
+    pass the same set as seen to several calls to count objects that
+    are shared between them only once.
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _NOT_TRAVERSED):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        if hasattr(current, '__dict__'):
+            stack.append(current.__dict__)
+    return size
+
+
+def instance_size(value_class):
+    """Return the estimated size of an instance of value_class in bytes.
+
+    An instance is constructed with every attribute set to None and
+    measured with :func:`deep_size`, excluding the attribute values and
+    the attribute names, which are shared by all instances. This
+    includes the bookkeeping of mutable value objects, such as the set
+    of changed attributes, and the cached hashes of immutable value
+    objects. Cached string representations are not included since
+    their size depends on the attribute values.
+    """
+    # pylint: disable=protected-access
+    fields = value_class._fields
+    if issubclass(value_class, ezvalue._MutableValueBase):
+        instance = value_class(**dict.fromkeys(fields))
+    else:
+        instance = value_class._from_fields(fields, (None,) * len(fields))
+        hash(instance)
+    seen = {id(None)}
+    seen.update(id(name) for name in instance.__dict__)
+    seen.update(id(name) for name in fields)
+    return deep_size(instance, seen)
+
+
+def track(*value_classes):
+    """Start tracking the live instances of the given value classes.
+
+    The mutable companion classes are tracked as well. Instances of
+    subclasses are counted with the nearest tracked base class unless
+    the subclass is tracked itself.
+    """
+    for value_class in value_classes:
+        _tracked.update((value_class, value_class.Mutable))
+
+
+def untrack(*value_classes):
+    """Stop tracking the live instances of the given value classes."""
+    for value_class in value_classes:
+        _tracked.difference_update((value_class, value_class.Mutable))
+
+
+def report(sizes=True):
+    """Return a dict with memory statistics of the tracked classes.
+
+    The dict maps the qualified class names to dicts with the number
+    of live instances, the estimated size of a single instance and, if
+    sizes is true, the total deep size of the live instances. Objects
+    shared between instances of a class are counted only once. Since
+    this visits every object known to the garbage collector it can be
+    slow.
+    """
+    result = {}
+    for cls, instances in _live_instances().items():
+        name = '{}.{}'.format(cls.__module__, cls.__qualname__)
+        entry = {'instances': len(instances),
+                 'instance_size': instance_size(cls)}
+        if sizes:
+            seen = set()
+            entry['total_size'] = sum(deep_size(instance, seen)
+                                      for instance in instances)
+        result[name] = entry
+    return result
+
+
+def format_report(statistics=None):
+    """Return the report as a human readable table.
+
+    If statistics is None a new report is created with :func:`report`.
+    """
+    if statistics is None:
+        statistics = report()
+    columns = ('instances', 'instance_size', 'total_size')
+    rows = [('class',) + columns]
+    for name in sorted(statistics):
+        entry = statistics[name]
+        rows.append((name,) + tuple(str(entry.get(column, '-'))
+                                    for column in columns))
+    widths = [max(len(row[index]) for row in rows)
+              for index in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        cells = [row[0].ljust(widths[0])]
+        cells.extend(cell.rjust(width)
+                     for cell, width in zip(row[1:], widths[1:]))
+        lines.append('  '.join(cells))
+    return '\n'.join(lines)
+
+
+def _live_instances():
+    instances = {cls: [] for cls in _tracked}
+    owners = {}
+    for obj in gc.get_objects():
+        kind = type(obj)
+        try:
+            owner = owners[kind]
+        except KeyError:
+            owner = owners[kind] = next(
+                (klass for klass in kind.__mro__ if klass in instances), None)
+        if owner is not None:
+            instances[owner].append(obj)
+    return instances
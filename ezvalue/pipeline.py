@@ -0,0 +1,167 @@
+"""Bulk construction of value objects in a process pool.
+
+This module provides the :class:`Pipeline` class which turns a large
+iterable of raw records into value objects. The input is split into
+chunks which are built, and optionally validated, by worker processes.
+The results are streamed back to the caller either in input order or
+in the order in which the chunks complete.
+
+Chunks are sent back to the parent process as plain tuples with the
+attribute values in a fixed field order instead of as pickled value
+objects, which is considerably more compact.
+
+Example::
+
+    pipeline = Pipeline(Point, workers=4, chunk_size=10000)
+    points = list(pipeline.map({'x': x, 'y': -x} for x in range(10)))
+
+Note that the value class and any transform or validate functions must
+be picklable, i.e. they must be defined at the top level of a module.
+"""
+
+import collections
+import collections.abc
+import concurrent.futures
+import itertools
+import os
+
+
+class Pipeline:
+    """Build value objects from raw records in parallel.
+
+    The value_class is the Value subclass to construct. Each raw
+    record is first passed to the optional transform function. The
+    (transformed) record is then used to construct the value object:
+    mappings are passed as keyword arguments, any other object is used
+    as the source object.
+
+    If validate is given it is called with every constructed value
+    object in the worker process. It should raise an exception if the
+    object is invalid, the exception is re-raised in the caller when
+    the corresponding chunk is retrieved.
+
+    The workers argument sets the number of worker processes, it
+    defaults to the number of CPUs. When workers is 0 the records are
+    processed in the calling process without a pool, which is useful
+    for small inputs and for debugging. The chunk_size is the number of
+    records sent to a worker at a time. At most max_pending chunks
+    are in flight at any time, bounding the memory usage; it defaults
+    to twice the number of workers.
+
+    If ordered is true the results are returned in the same order as
+    the input records, otherwise they are returned as soon as their
+    chunk is done.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, value_class, transform=None, validate=None,
+                 workers=None, chunk_size=1000, ordered=True,
+                 max_pending=None):
+        """Create a pipeline, see the class documentation."""
+        # pylint: disable=too-many-arguments
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1.')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.value_class = value_class
+        self.transform = transform
+        self.validate = validate
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.max_pending = max_pending or 2 * max(workers, 1)
+        self._fields = value_class._fields
+
+    def map(self, records):
+        """Return an iterator over value objects built from records.
+
+        The records are consumed lazily so the input can be a
+        generator that is larger than the available memory, as long as
+        the results are consumed as they are produced. If the iterator
+        is closed before it is exhausted the chunks that have not
+        started yet are cancelled.
+        """
+        # pylint: disable=protected-access
+        chunks = _chunked(records, self.chunk_size)
+        if not self.workers:
+            for chunk in chunks:
+                for value in self._build_chunk(chunk):
+                    yield value
+            return
+        executor = concurrent.futures.ProcessPoolExecutor(self.workers)
+        submitted = set()
+        try:
+            if self.ordered:
+                results = self._map_ordered(executor, chunks, submitted)
+            else:
+                results = self._map_unordered(executor, chunks, submitted)
+            for rows in results:
+                for row in rows:
+                    yield self.value_class._from_fields(self._fields, row)
+        finally:
+            for future in list(submitted):
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _submit(self, executor, chunk, submitted):
+        future = executor.submit(_build_rows, self.value_class, self._fields,
+                                 self.transform, self.validate, chunk)
+        submitted.add(future)
+        future.add_done_callback(submitted.discard)
+        return future
+
+    def _map_ordered(self, executor, chunks, submitted):
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(self._submit(executor, chunk, submitted))
+            if len(pending) >= self.max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def _map_unordered(self, executor, chunks, submitted):
+        pending = set()
+        for chunk in chunks:
+            pending.add(self._submit(executor, chunk, submitted))
+            if len(pending) >= self.max_pending:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in concurrent.futures.as_completed(pending):
+            yield future.result()
+
+    def _build_chunk(self, chunk):
+        return _build_values(self.value_class, self.transform,
+                             self.validate, chunk)
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _build_values(value_class, transform, validate, records):
+    values = []
+    for record in records:
+        if transform is not None:
+            record = transform(record)
+        if isinstance(record, collections.abc.Mapping):
+            value = value_class(**record)
+        else:
+            value = value_class(record)
+        if validate is not None:
+            validate(value)
+        values.append(value)
+    return values
+
+
+def _build_rows(value_class, fields, transform, validate, records):
+    values = _build_values(value_class, transform, validate, records)
+    return [tuple(value.__dict__[name] for name in fields)
+            for value in values]
@@ -0,0 +1,214 @@
+"""Reconciliation of two datasets of value objects.
+
+This module provides the :class:`Reconciler` class which compares two
+snapshots of the same kind of value objects, e.g. yesterday's and
+today's positions, and streams out the records that were added,
+removed or changed. Records are matched on a set of key attributes.
+
+To bound the memory usage both sides can be hash partitioned on the
+key and spilled to temporary files, after which the partitions are
+compared one at a time. The partitions can also be compared in a
+process pool to spread the work over multiple cores.
+
+Example::
+
+    reconciler = Reconciler(Position, key=('account', 'symbol'),
+                            partitions=64, workers=4)
+    for change in reconciler.diff(yesterday, today):
+        print(change.kind, change.key, change.differences)
+"""
+
+import collections
+import concurrent.futures
+import operator
+import os
+import pickle
+import tempfile
+
+import ezvalue
+
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+
+class Change(ezvalue.Value):
+    """A difference between two datasets for a single key."""
+
+    kind = """Either 'added', 'removed' or 'changed'."""
+    key = """The key of the record, a tuple if there are multiple keys."""
+    old = """The old record or None if the record was added."""
+    new = """The new record or None if the record was removed."""
+    differences = """Tuple of (name, old value, new value) tuples.
+
+    Only the changed attributes are included, in definition order. Empty
+    for added and removed records.
+    """
+
+
+class Reconciler:
+    """Compare two datasets of value objects.
+
+    The value_class is the Value subclass of the records on both sides
+    and key is the name of the key attribute or a sequence of names.
+    The key must be unique within each dataset, otherwise a ValueError
+    is raised.
+
+    With a single partition the old dataset is loaded in memory and the
+    new dataset is streamed. With more partitions both datasets are
+    first written to temporary files in directory, which defaults to
+    the system's temporary directory, so that only a single partition
+    of the old dataset has to fit in memory. If workers is non-zero the
+    partitions are compared in a pool of that many processes.
+    """
+
+    def __init__(self, value_class, key, partitions=1, workers=0,
+                 directory=None):
+        """Create a reconciler, see the class documentation."""
+        if isinstance(key, str):
+            key = (key,)
+        if not key:
+            raise ValueError('At least one key attribute must be given.')
+        if partitions < 1:
+            raise ValueError('partitions must be at least 1.')
+        self.value_class = value_class
+        self.key = tuple(key)
+        self.partitions = partitions
+        self.workers = workers
+        self.directory = directory
+        self._fields = value_class._fields
+        self._key_indices = tuple(self._fields.index(name)
+                                  for name in self.key)
+
+    def diff(self, old, new):
+        """Return an iterator over the changes from old to new.
+
+        Both old and new may be any iterable of value objects, or other
+        objects with the same attributes. Within a partition changed
+        and added records are returned in the order of new, followed
+        by the removed records.
+        """
+        if self.partitions == 1 and not self.workers:
+            results = _diff_rows(self._fields, self._key_indices,
+                                 self._rows(old), self._rows(new))
+            return self._to_changes(results)
+        return self._diff_partitioned(old, new)
+
+    def _diff_partitioned(self, old, new):
+        with tempfile.TemporaryDirectory(dir=self.directory) as directory:
+            old_paths = self._spill(old, directory, 'old')
+            new_paths = self._spill(new, directory, 'new')
+            jobs = zip(old_paths, new_paths)
+            if self.workers:
+                executor = concurrent.futures.ProcessPoolExecutor(
+                    self.workers)
+                pending = collections.deque()
+                try:
+                    for results in self._map_partitions(executor, jobs,
+                                                        pending):
+                        for change in self._to_changes(results):
+                            yield change
+                finally:
+                    # The workers read the spill files, so they must be
+                    # done before the directory is removed.
+                    for future in pending:
+                        future.cancel()
+                    executor.shutdown(wait=True)
+            else:
+                for paths in jobs:
+                    results = _diff_partition(self._fields,
+                                              self._key_indices, *paths)
+                    for change in self._to_changes(results):
+                        yield change
+
+    def _map_partitions(self, executor, jobs, pending):
+        for paths in jobs:
+            pending.append(executor.submit(_diff_partition, self._fields,
+                                           self._key_indices, *paths))
+            if len(pending) >= 2 * self.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def _rows(self, values):
+        # pylint: disable=protected-access
+        get_row = self.value_class._get_values
+        return (get_row(value) for value in values)
+
+    def _spill(self, values, directory, prefix):
+        paths = [os.path.join(directory, '{}-{}'.format(prefix, index))
+                 for index in range(self.partitions)]
+        files = [open(path, 'wb') for path in paths]
+        try:
+            get_key = _key_getter(self._key_indices)
+            # Every row is pickled separately, a shared Pickler would keep
+            # all rows alive in its memo.
+            for row in self._rows(values):
+                files[hash(get_key(row)) % self.partitions].write(
+                    pickle.dumps(row, pickle.HIGHEST_PROTOCOL))
+        finally:
+            for file in files:
+                file.close()
+        return paths
+
+    def _to_changes(self, results):
+        # pylint: disable=protected-access
+        from_fields = self.value_class._from_fields
+        fields = self._fields
+        for kind, key, old_row, new_row, changed in results:
+            yield Change(
+                kind=kind, key=key,
+                old=None if old_row is None else from_fields(fields, old_row),
+                new=None if new_row is None else from_fields(fields, new_row),
+                differences=tuple((fields[index], old_row[index],
+                                   new_row[index])
+                                  for index in changed))
+
+
+def _key_getter(key_indices):
+    if len(key_indices) == 1:
+        return operator.itemgetter(key_indices[0])
+    return operator.itemgetter(*key_indices)
+
+
+def _diff_rows(fields, key_indices, old_rows, new_rows):
+    get_key = _key_getter(key_indices)
+    old = {}
+    for row in old_rows:
+        key = get_key(row)
+        if key in old:
+            raise ValueError('Duplicate key {!r} in old dataset.'
+                             .format(key))
+        old[key] = row
+    seen = set()
+    indices = range(len(fields))
+    for row in new_rows:
+        key = get_key(row)
+        if key in seen:
+            raise ValueError('Duplicate key {!r} in new dataset.'
+                             .format(key))
+        seen.add(key)
+        old_row = old.pop(key, None)
+        if old_row is None:
+            yield ADDED, key, None, row, ()
+        elif old_row != row:
+            changed = tuple(index for index in indices
+                            if old_row[index] != row[index])
+            yield CHANGED, key, old_row, row, changed
+    for key, row in old.items():
+        yield REMOVED, key, row, None, ()
+
+
+def _load_rows(path):
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def _diff_partition(fields, key_indices, old_path, new_path):
+    return list(_diff_rows(fields, key_indices, _load_rows(old_path),
+                           _load_rows(new_path)))
@@ -0,0 +1,156 @@
+"""Weakly keyed caches for value objects.
+
+The :class:`ValueWeakCache` class maps value objects to arbitrary data
+without keeping the value objects alive, for example to attach computed
+metadata to values. Entries disappear automatically when the value
+objects they belong to are garbage collected, so the memory usage of a
+long-running process stays flat.
+
+Every value object can be weakly referenced, including the mutable
+companions and views. There is no compact mode without an instance
+dict: the attributes and cached hashes of value objects are kept in
+their instance dict, so the value classes never use ``__slots__`` and
+a subclass that declares ``__slots__`` still gets ``__weakref__`` from
+its base classes.
+
+Two value objects that are equal are usually different objects, so
+the cache can either be keyed by identity or by equality:
+
+- With ``by='identity'`` every object has its own entry, even if it is
+  equal to another object. Any object that supports weak references
+  can be used as a key, including mutable value objects.
+- With ``by='equality'`` equal objects share an entry. The entry is
+  kept as long as any of the objects that were used to store it is
+  alive. Keys must be immutable since their hash must not change.
+
+Example::
+
+    metadata = ValueWeakCache(by='equality')
+    metadata[point] = compute_metadata(point)
+"""
+
+import collections.abc
+import weakref
+
+
+class _Entry:
+    __slots__ = ('key', 'value', 'members')
+
+    def __init__(self, value):
+        self.key = None
+        self.value = value
+        self.members = {}
+
+
+class _MemberRef(weakref.ref):
+    """A weak reference to a key that knows its cache entry."""
+
+    __slots__ = ('entry', 'key_id')
+
+    def __new__(cls, key, callback, entry):
+        # pylint: disable=too-many-function-args
+        self = super().__new__(cls, key, callback)
+        self.entry = entry
+        self.key_id = id(key)
+        return self
+
+    def __init__(self, key, callback, entry):
+        # pylint: disable=unused-argument
+        super().__init__(key, callback)
+
+
+class ValueWeakCache(collections.abc.MutableMapping):
+    """A mapping that holds its keys weakly.
+
+    The by argument selects whether keys are compared by 'identity'
+    or by 'equality', see the module documentation. The cache supports
+    the full mutable mapping interface, iterating over the cache
+    returns one live key for every entry.
+    """
+
+    def __init__(self, by='identity'):
+        """Create an empty cache, see the class documentation."""
+        if by not in ('identity', 'equality'):
+            raise ValueError("by must be 'identity' or 'equality'.")
+        self._by_equality = by == 'equality'
+        self._entries = {}
+        self_ref = weakref.ref(self)
+
+        def remove(member):
+            # pylint: disable=protected-access
+            cache = self_ref()
+            if cache is not None:
+                cache._remove(member)
+
+        self._remove_callback = remove
+
+    def __getitem__(self, key):
+        """Return the value stored for key."""
+        return self._entries[self._lookup_key(key)].value
+
+    def __setitem__(self, key, value):
+        """Store value for key without keeping key alive.
+
+        In equality mode the entry is kept alive by key as well as by
+        the equal keys it was stored with before.
+        """
+        lookup_key = self._lookup_key(key)
+        entry = self._entries.get(lookup_key)
+        if entry is None:
+            entry = _Entry(value)
+            member = self._add_member(entry, key)
+            entry.key = member if self._by_equality else lookup_key
+            self._entries[entry.key] = entry
+        else:
+            entry.value = value
+            if id(key) not in entry.members:
+                self._add_member(entry, key)
+
+    def __delitem__(self, key):
+        """Remove the entry for key."""
+        entry = self._entries.pop(self._lookup_key(key))
+        for member in entry.members.values():
+            member.entry = None
+
+    def __iter__(self):
+        """Return an iterator over a live key of every entry."""
+        for entry in list(self._entries.values()):
+            for member in list(entry.members.values()):
+                key = member()
+                if key is not None:
+                    yield key
+                    break
+
+    def __len__(self):
+        """Return the number of entries."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Return whether there is an entry for key."""
+        try:
+            return self._lookup_key(key) in self._entries
+        except TypeError:
+            return False
+
+    def _lookup_key(self, key):
+        if self._by_equality:
+            return weakref.ref(key)
+        return id(key)
+
+    def _add_member(self, entry, key):
+        member = _MemberRef(key, self._remove_callback, entry)
+        entry.members[id(key)] = member
+        return member
+
+    def _remove(self, member):
+        entry = member.entry
+        if entry is None:
+            return
+        member.entry = None
+        del entry.members[member.key_id]
+        if not entry.members:
+            del self._entries[entry.key]
+        elif entry.key is member:
+            del self._entries[entry.key]
+            entry.key = next(iter(entry.members.values()))
+            self._entries[entry.key] = entry
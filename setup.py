@@ -26,14 +26,13 @@ setuptools.setup(
                  'Intended Audience :: Developers',
                  'Topic :: Software Development',
                  'Programming Language :: Python :: 3',
-                 'Programming Language :: Python :: 3.2',
-                 'Programming Language :: Python :: 3.3',
-                 'Programming Language :: Python :: 3.4',
-                 'Programming Language :: Python :: 3.5',
                  'Programming Language :: Python :: 3.6',
+                 'Programming Language :: Python :: 3.7',
+                 'Programming Language :: Python :: 3.8',
                  ],
 
     keywords='value valueobject immutable',
 
     packages=['ezvalue'],
+    python_requires='>=3.6',
 )
@@ -0,0 +1,101 @@
+# pylint: disable=blacklisted-name
+
+import threading
+import unittest
+
+import ezvalue
+
+
+class Pair(ezvalue.Value):
+    """Value object whose attributes are always updated together."""
+
+    first = """Docstring 1."""
+    second = """Docstring 2."""
+
+
+class TestConcurrentMutable(unittest.TestCase):
+    WRITERS = 4
+    READERS = 4
+    ITERATIONS = 5000
+
+    def test_readers_always_see_consistent_state(self):
+        pair = Pair.ConcurrentMutable(first=0, second=0)
+        errors = []
+        done = threading.Event()
+
+        def write(offset):
+            for i in range(self.ITERATIONS):
+                value = i * self.WRITERS + offset
+                pair.update(first=value, second=-value)
+
+        def read():
+            while not done.is_set():
+                snapshot = pair.snapshot()
+                immutable = pair.to_immutable()
+                for value in (snapshot, immutable):
+                    if value.first != -value.second:
+                        errors.append(value)
+
+        readers = [threading.Thread(target=read)
+                   for _ in range(self.READERS)]
+        writers = [threading.Thread(target=write, args=(offset,))
+                   for offset in range(self.WRITERS)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(pair.first, -pair.second)
+
+    def test_comparisons_see_consistent_state(self):
+        pair = Pair.ConcurrentMutable(first=1, second=-1)
+        mixed = (Pair(first=1, second=-2), Pair(first=2, second=-1),
+                 Pair.view({'first': 1, 'second': -2}))
+        errors = []
+        done = threading.Event()
+
+        def write():
+            for i in range(self.ITERATIONS):
+                value = i % 2 + 1
+                pair.update(first=value, second=-value)
+
+        def read():
+            while not done.is_set():
+                for value in mixed:
+                    if value == pair or pair == value:
+                        errors.append(value)
+
+        readers = [threading.Thread(target=read)
+                   for _ in range(self.READERS)]
+        writers = [threading.Thread(target=write)
+                   for _ in range(self.WRITERS)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    def test_updates_of_different_attributes_are_not_lost(self):
+        pair = Pair.ConcurrentMutable(first=0, second=0)
+
+        def write(name):
+            for i in range(1, self.ITERATIONS + 1):
+                setattr(pair, name, i)
+
+        threads = [threading.Thread(target=write, args=(name,))
+                   for name in ('first', 'second')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(pair.to_immutable(),
+                         Pair(first=self.ITERATIONS, second=self.ITERATIONS))
@@ -0,0 +1,193 @@
+# pylint: disable=blacklisted-name
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import ezvalue
+from ezvalue.cache import CacheStats, PersistentCache, memoize, stable_key
+
+
+class Foo(ezvalue.Value):
+    """Value object docstring."""
+
+    bar = """Docstring 1."""
+    baz = """Docstring 2."""
+
+
+class TestStableKey(unittest.TestCase):
+    def test_equal_values_have_equal_keys(self):
+        self.assertEqual(stable_key(Foo(bar=1, baz='hi')),
+                         stable_key(Foo(bar=1, baz='hi')))
+
+    def test_different_values_have_different_keys(self):
+        self.assertNotEqual(stable_key(Foo(bar=1, baz='hi')),
+                            stable_key(Foo(bar=2, baz='hi')))
+
+    def test_key_depends_on_type(self):
+        self.assertNotEqual(stable_key(1), stable_key('1'))
+        self.assertNotEqual(stable_key((1, 2)), stable_key([1, 2]))
+
+    def test_key_does_not_depend_on_set_order(self):
+        self.assertEqual(stable_key({'a', 'b', 'c'}),
+                         stable_key({'c', 'b', 'a'}))
+
+    def test_key_is_stable_across_processes(self):
+        code = ('import ezvalue.cache;'
+                'print(ezvalue.cache.stable_key({"a": ("b", 1.5)}))')
+        environment = dict(os.environ, PYTHONHASHSEED='random')
+        keys = {subprocess.check_output([sys.executable, '-c', code],
+                                        env=environment)
+                for _ in range(3)}
+        self.assertEqual(len(keys), 1)
+
+    def test_unsupported_type_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            stable_key(object())
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_missing_returns_default(self):
+        cache = PersistentCache()
+        self.assertEqual(cache.get(Foo(bar=1, baz='hi'), 'spam'), 'spam')
+
+    def test_set_and_get(self):
+        cache = PersistentCache()
+        cache.set(Foo(bar=1, baz='hi'), 'spam')
+        self.assertEqual(cache.get(Foo(bar=1, baz='hi')), 'spam')
+
+    def test_memory_tier_is_lru(self):
+        cache = PersistentCache(maxsize=2)
+        cache.set(1, 'a')
+        cache.set(2, 'b')
+        cache.get(1)
+        cache.set(3, 'c')
+        self.assertEqual(cache.get(1), 'a')
+        self.assertIsNone(cache.get(2))
+
+    def test_entries_survive_reopening(self):
+        cache = PersistentCache(self.path)
+        cache.set(Foo(bar=1, baz='hi'), Foo(bar=2, baz='bye'))
+        cache.close()
+        cache = PersistentCache(self.path)
+        self.assertEqual(cache.get(Foo(bar=1, baz='hi')),
+                         Foo(bar=2, baz='bye'))
+        cache.close()
+
+    def test_expired_entries_are_missing(self):
+        cache = PersistentCache(self.path, ttl=10)
+        with mock.patch('time.time', return_value=100):
+            cache.set('key', 'value')
+        with mock.patch('time.time', return_value=105):
+            self.assertEqual(cache.get('key'), 'value')
+        with mock.patch('time.time', return_value=111):
+            self.assertIsNone(cache.get('key'))
+        cache.close()
+
+    def test_disk_tier_evicts_least_recently_accessed(self):
+        cache = PersistentCache(self.path, maxsize=0, max_entries=2)
+        with mock.patch('time.time', return_value=1):
+            cache.set(1, 'a')
+        with mock.patch('time.time', return_value=2):
+            cache.set(2, 'b')
+        with mock.patch('time.time', return_value=3):
+            cache.get(1)
+        with mock.patch('time.time', return_value=4):
+            cache.set(3, 'c')
+        self.assertEqual(cache.get(1), 'a')
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.stats().evictions, 1)
+        cache.close()
+
+    def test_disk_tier_limit_is_shared_between_caches(self):
+        first = PersistentCache(self.path, maxsize=0, max_entries=2)
+        second = PersistentCache(self.path, maxsize=0, max_entries=2)
+        with mock.patch('time.time', return_value=1):
+            first.set(1, 'a')
+        with mock.patch('time.time', return_value=2):
+            second.set(2, 'b')
+        with mock.patch('time.time', return_value=3):
+            first.set(3, 'c')
+        self.assertIsNone(second.get(1))
+        self.assertEqual(second.get(2), 'b')
+        self.assertEqual(second.get(3), 'c')
+        self.assertEqual(first.stats().evictions, 1)
+        first.close()
+        second.close()
+
+    def test_expired_entries_do_not_count_towards_limit(self):
+        cache = PersistentCache(self.path, maxsize=0, ttl=10, max_entries=2)
+        with mock.patch('time.time', return_value=1):
+            cache.set(1, 'a')
+        with mock.patch('time.time', return_value=20):
+            cache.set(2, 'b')
+            cache.set(3, 'c')
+            self.assertEqual(cache.get(2), 'b')
+            self.assertEqual(cache.get(3), 'c')
+        self.assertEqual(cache.stats().evictions, 0)
+        cache.close()
+
+    def test_stats(self):
+        cache = PersistentCache(self.path, maxsize=1)
+        cache.set(1, 'a')
+        cache.set(2, 'b')
+        cache.get(2)
+        cache.get(1)
+        cache.get(3)
+        self.assertEqual(cache.stats(), CacheStats(
+            hits=2, misses=1, memory_hits=1, disk_hits=1, evictions=0))
+        cache.close()
+
+    def test_clear(self):
+        cache = PersistentCache(self.path)
+        cache.set(1, 'a')
+        cache.clear()
+        self.assertIsNone(cache.get(1))
+        cache.close()
+
+
+class TestMemoize(unittest.TestCase):
+    def test_results_are_cached(self):
+        calls = []
+
+        @memoize()
+        def double(foo):
+            calls.append(foo)
+            return foo.bar * 2
+
+        self.assertEqual(double(Foo(bar=1, baz='hi')), 2)
+        self.assertEqual(double(Foo(bar=1, baz='hi')), 2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(double.cache.stats().hits, 1)
+
+    def test_functions_sharing_a_cache_have_separate_keys(self):
+        cache = PersistentCache()
+
+        @memoize(cache)
+        def first(value):
+            return 'first'
+
+        @memoize(cache)
+        def second(value):
+            return 'second'
+
+        self.assertEqual(first(1), 'first')
+        self.assertEqual(second(1), 'second')
+
+    def test_keyword_arguments_are_part_of_key(self):
+        @memoize()
+        def function(value=0):
+            return value
+
+        self.assertEqual(function(value=1), 1)
+        self.assertEqual(function(value=2), 2)
@@ -0,0 +1,98 @@
+# pylint: disable=blacklisted-name
+
+import unittest
+
+import ezvalue
+from ezvalue import collection
+
+
+class Foo(ezvalue.Value):
+    """Value object docstring."""
+
+    bar = """Docstring 1."""
+    baz = """Docstring 2."""
+
+
+FOOS = [Foo(bar=1, baz='a'), Foo(bar=2, baz='a'), Foo(bar=1, baz='a'),
+        Foo(bar=1, baz='b')]
+
+COLUMNS = {'bar': [1, 2, 1, 1], 'baz': ['a', 'a', 'a', 'b']}
+
+
+class TestUnique(unittest.TestCase):
+    def test_unique_values(self):
+        self.assertEqual(list(collection.unique(FOOS)),
+                         [FOOS[0], FOOS[1], FOOS[3]])
+
+    def test_unique_on_fields(self):
+        self.assertEqual(list(collection.unique(FOOS, 'baz')),
+                         [FOOS[0], FOOS[3]])
+
+    def test_unique_keeps_first_occurrence(self):
+        result = list(collection.unique(FOOS, 'bar'))
+        self.assertIs(result[0], FOOS[0])
+
+    def test_unique_accepts_iterator(self):
+        self.assertEqual(len(list(collection.unique(iter(FOOS)))), 3)
+
+    def test_unique_columns(self):
+        self.assertEqual(list(collection.unique(COLUMNS)), [0, 1, 3])
+
+    def test_unique_columns_on_fields(self):
+        self.assertEqual(list(collection.unique(COLUMNS, 'baz')), [0, 3])
+
+
+class TestGroupBy(unittest.TestCase):
+    def test_group_by_single_field(self):
+        groups = collection.group_by(FOOS, 'bar')
+        self.assertEqual(groups, {1: [FOOS[0], FOOS[2], FOOS[3]],
+                                  2: [FOOS[1]]})
+
+    def test_group_by_multiple_fields(self):
+        groups = collection.group_by(FOOS, 'bar', 'baz')
+        self.assertEqual(list(groups), [(1, 'a'), (2, 'a'), (1, 'b')])
+
+    def test_group_by_columns(self):
+        groups = collection.group_by(COLUMNS, 'baz')
+        self.assertEqual(groups, {'a': [0, 1, 2], 'b': [3]})
+
+    def test_group_by_without_fields_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            collection.group_by(FOOS)
+
+    def test_group_by_unknown_field_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            collection.group_by(FOOS, 'spam')
+
+
+class TestCountBy(unittest.TestCase):
+    def test_count_by(self):
+        self.assertEqual(collection.count_by(FOOS, 'baz'), {'a': 3, 'b': 1})
+
+    def test_count_by_multiple_fields(self):
+        counts = collection.count_by(FOOS, 'bar', 'baz')
+        self.assertEqual(counts[(1, 'a')], 2)
+
+    def test_count_by_columns(self):
+        counts = collection.count_by(COLUMNS, 'bar', 'baz')
+        self.assertEqual(counts, {(1, 'a'): 2, (2, 'a'): 1, (1, 'b'): 1})
+
+
+class TestAggregate(unittest.TestCase):
+    def test_aggregate(self):
+        totals = collection.aggregate(FOOS, ('baz',), 'bar', sum)
+        self.assertEqual(totals, {'a': 4, 'b': 1})
+
+    def test_aggregate_multiple_fields(self):
+        totals = collection.aggregate(FOOS, ('bar', 'baz'), 'bar', len)
+        self.assertEqual(totals, {(1, 'a'): 2, (2, 'a'): 1, (1, 'b'): 1})
+
+    def test_aggregate_single_field_name(self):
+        totals = collection.aggregate(FOOS, 'baz', 'bar', sum)
+        self.assertEqual(totals, {'a': 4, 'b': 1})
+        totals = collection.aggregate(COLUMNS, 'baz', 'bar', sum)
+        self.assertEqual(totals, {'a': 4, 'b': 1})
+
+    def test_aggregate_columns(self):
+        maxima = collection.aggregate(COLUMNS, ('baz',), 'bar', max)
+        self.assertEqual(maxima, {'a': 2, 'b': 1})
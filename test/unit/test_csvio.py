@@ -0,0 +1,113 @@
+# pylint: disable=blacklisted-name
+
+import io
+import os
+import tempfile
+import unittest
+
+import ezvalue
+
+
+class Foo(ezvalue.Value):
+    """Value object docstring."""
+
+    bar = """Docstring 1."""
+    baz = """Docstring 2."""
+
+
+class Positive(ezvalue.Value):
+    """Value object with validation in the constructor."""
+
+    number = """Docstring."""
+
+    def __init__(self, source=None, **kwargs):
+        super().__init__(source, **kwargs)
+        if self.number < 0:
+            raise ValueError('negative number')
+
+
+class TestReadCsv(unittest.TestCase):
+    def test_read(self):
+        file = io.StringIO('bar,baz\n1,hi\n2,bye\n')
+        self.assertEqual(list(Foo.read_csv(file)),
+                         [Foo(bar='1', baz='hi'), Foo(bar='2', baz='bye')])
+
+    def test_blank_lines_are_skipped(self):
+        file = io.StringIO('bar,baz\n1,hi\n\n2,bye\n\n')
+        self.assertEqual(list(Foo.read_csv(file)),
+                         [Foo(bar='1', baz='hi'), Foo(bar='2', baz='bye')])
+
+    def test_columns_are_mapped_by_header(self):
+        file = io.StringIO('spam,baz,bar\nx,hi,1\n')
+        self.assertEqual(list(Foo.read_csv(file)), [Foo(bar='1', baz='hi')])
+
+    def test_converters(self):
+        file = io.StringIO('bar,baz\n1,hi\n')
+        foos = list(Foo.read_csv(file, converters={'bar': int}))
+        self.assertEqual(foos, [Foo(bar=1, baz='hi')])
+
+    def test_results_are_immutable(self):
+        foo = next(Foo.read_csv(io.StringIO('bar,baz\n1,hi\n')))
+        with self.assertRaises(AttributeError):
+            foo.bar = 3
+
+    def test_fmtparams(self):
+        file = io.StringIO('bar;baz\n1;hi\n')
+        self.assertEqual(list(Foo.read_csv(file, delimiter=';')),
+                         [Foo(bar='1', baz='hi')])
+
+    def test_missing_column_raises_value_error(self):
+        with self.assertRaisesRegex(ValueError, 'baz'):
+            list(Foo.read_csv(io.StringIO('bar\n1\n')))
+
+    def test_empty_file_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            list(Foo.read_csv(io.StringIO('')))
+
+    def test_unknown_converter_raises_value_error(self):
+        with self.assertRaisesRegex(ValueError, 'spam'):
+            Foo.read_csv(io.StringIO('bar,baz\n'), converters={'spam': int})
+
+    def test_converter_error_contains_line_number(self):
+        file = io.StringIO('bar,baz\n1,hi\nx,bye\n')
+        with self.assertRaisesRegex(ValueError, 'Line 3'):
+            list(Foo.read_csv(file, converters={'bar': int}))
+
+    def test_wrong_number_of_columns_contains_line_number(self):
+        file = io.StringIO('bar,baz\n1,hi\n2\n')
+        with self.assertRaisesRegex(ValueError, 'Line 3'):
+            list(Foo.read_csv(file))
+
+    def test_invalid_quoting_contains_line_number(self):
+        file = io.StringIO('bar,baz\n1,hi\n"2"x,bye\n')
+        with self.assertRaisesRegex(ValueError, 'Line 3'):
+            list(Foo.read_csv(file, strict=True))
+
+    def test_custom_init_is_called(self):
+        file = io.StringIO('number\n1\n-1\n')
+        with self.assertRaisesRegex(ValueError, 'Line 3: negative'):
+            list(Positive.read_csv(file, converters={'number': int}))
+
+
+class TestWriteCsv(unittest.TestCase):
+    def test_write(self):
+        file = io.StringIO()
+        Foo.write_csv([Foo(bar=1, baz='hi'), Foo(bar=2, baz='bye')], file)
+        self.assertEqual(file.getvalue(), 'bar,baz\r\n1,hi\r\n2,bye\r\n')
+
+    def test_write_without_header(self):
+        file = io.StringIO()
+        Foo.write_csv([Foo(bar=1, baz='hi')], file, header=False)
+        self.assertEqual(file.getvalue(), '1,hi\r\n')
+
+    def test_single_attribute(self):
+        file = io.StringIO()
+        Positive.write_csv([Positive(number=1)], file)
+        self.assertEqual(file.getvalue(), 'number\r\n1\r\n')
+
+    def test_round_trip_through_path(self):
+        foos = [Foo(bar='1', baz='hi, there'), Foo(bar='2', baz='"bye"')]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'foos.csv')
+            Foo.write_csv(foos, path)
+            self.assertEqual(list(Foo.read_csv(path)), foos)
@@ -0,0 +1,124 @@
+# pylint: disable=blacklisted-name,protected-access
+
+import gc
+import sys
+import unittest
+
+import ezvalue
+from ezvalue import memory
+
+
+class Foo(ezvalue.Value):
+    """Value object docstring."""
+
+    bar = """Docstring 1."""
+    baz = """Docstring 2."""
+
+
+CREATED = []
+
+
+class Counted(Foo):
+    """Value object that records its instances in __new__."""
+
+    def __new__(cls, *args, **kwargs):
+        # pylint: disable=unused-argument
+        instance = super().__new__(cls)
+        CREATED.append(id(instance))
+        return instance
+
+
+FOO_NAME = '{}.Foo'.format(__name__)
+
+
+class TestDeepSize(unittest.TestCase):
+    def test_includes_attribute_values(self):
+        small = Foo(bar=1, baz='hi')
+        large = Foo(bar=1, baz=list(range(1000)))
+        self.assertGreater(memory.deep_size(large),
+                           memory.deep_size(small) +
+                           sys.getsizeof(list(range(1000))))
+
+    def test_includes_extra_attributes_of_mutable(self):
+        foo = Foo.Mutable(bar=1, baz='hi')
+        size = memory.deep_size(foo)
+        foo.spam = 'x' * 1000
+        self.assertGreater(memory.deep_size(foo), size + 1000)
+
+    def test_shared_objects_counted_once(self):
+        shared = 'x' * 1000
+        self.assertLess(memory.deep_size([shared, shared]),
+                        2 * sys.getsizeof(shared))
+
+
+class TestInstanceSize(unittest.TestCase):
+    def test_instance_size_includes_cached_hashes(self):
+        foo = Foo(bar=None, baz=None)
+        hash(foo)
+        self.assertGreaterEqual(memory.instance_size(Foo),
+                                sys.getsizeof(foo) +
+                                sys.getsizeof(foo.__dict__) +
+                                sys.getsizeof(foo._field_hashes()))
+
+    def test_instance_size_includes_mutable_bookkeeping(self):
+        foo = Foo.Mutable(bar=None, baz=None)
+        self.assertGreaterEqual(memory.instance_size(Foo.Mutable),
+                                sys.getsizeof(foo) +
+                                sys.getsizeof(foo.__dict__) +
+                                sys.getsizeof(foo._changed))
+
+    def test_instance_size_of_concurrent_mutable(self):
+        self.assertGreater(memory.instance_size(Foo.ConcurrentMutable),
+                           memory.instance_size(Foo))
+
+
+class TestTracking(unittest.TestCase):
+    def setUp(self):
+        memory.track(Foo)
+        self.addCleanup(memory.untrack, Foo)
+
+    def test_counts_live_instances(self):
+        foos = [Foo(bar=i, baz='hi') for i in range(3)]
+        mutable_foo = foos[0].to_mutable()
+        mutable_foo.bar = 5
+        foos.append(mutable_foo.to_immutable())
+        statistics = memory.report()
+        self.assertEqual(statistics[FOO_NAME]['instances'], 4)
+        self.assertEqual(statistics[FOO_NAME + '.Mutable']['instances'], 1)
+
+    def test_dead_instances_are_not_counted(self):
+        foo = Foo(bar=1, baz='hi')
+        del foo
+        gc.collect()
+        self.assertEqual(memory.report()[FOO_NAME]['instances'], 0)
+
+    def test_untrack(self):
+        memory.untrack(Foo)
+        Foo(bar=1, baz='hi')
+        self.assertNotIn(FOO_NAME, memory.report())
+
+    def test_tracking_does_not_change_the_class(self):
+        self.assertNotIn('__new__', Foo.__dict__)
+        self.assertNotIn('__new__', Foo.Mutable.__dict__)
+
+    def test_custom_new_is_still_called(self):
+        memory.track(Counted)
+        self.addCleanup(memory.untrack, Counted)
+        counted = Counted(bar=1, baz='hi')
+        self.assertEqual(CREATED[-1], id(counted))
+        statistics = memory.report(sizes=False)
+        self.assertEqual(statistics[FOO_NAME[:-3] + 'Counted']['instances'],
+                         1)
+        self.assertIsNotNone(counted)
+
+    def test_subclasses_are_counted_with_tracked_base(self):
+        counted = Counted(bar=1, baz='hi')
+        self.assertEqual(memory.report()[FOO_NAME]['instances'], 1)
+        self.assertIsNotNone(counted)
+
+    def test_format_report(self):
+        foo = Foo(bar=1, baz='hi')
+        table = memory.format_report()
+        self.assertIn(FOO_NAME, table)
+        self.assertIn('instances', table.splitlines()[0])
+        self.assertIsNotNone(foo)
@@ -0,0 +1,131 @@
+# pylint: disable=blacklisted-name,protected-access
+
+import collections
+import concurrent.futures
+import unittest
+from unittest import mock
+
+import ezvalue
+from ezvalue.pipeline import Pipeline
+
+
+class Foo(ezvalue.Value):
+    """Value object docstring."""
+
+    bar = """Docstring 1."""
+    baz = """Docstring 2."""
+
+
+FooTuple = collections.namedtuple('FooTuple', ('bar', 'baz'))
+
+
+def swap(record):
+    return {'bar': record['baz'], 'baz': record['bar']}
+
+
+def positive_bar(foo):
+    if foo.bar < 0:
+        raise ValueError('negative bar')
+
+
+def records(count):
+    return ({'bar': i, 'baz': str(i)} for i in range(count))
+
+
+def expected(count):
+    return [Foo(bar=i, baz=str(i)) for i in range(count)]
+
+
+class LazyFuture(concurrent.futures.Future):
+    """Future that only runs its call when the result is requested."""
+
+    def __init__(self, function, args):
+        super().__init__()
+        self.call = (function, args)
+
+    def result(self, timeout=None):
+        if not self.done():
+            self.set_running_or_notify_cancel()
+            function, args = self.call
+            try:
+                self.set_result(function(*args))
+            except Exception as error:  # pylint: disable=broad-except
+                self.set_exception(error)
+        return super().result(timeout)
+
+
+class LazyExecutor(concurrent.futures.Executor):
+    """Executor that runs calls in the caller when their result is used."""
+
+    instances = []
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.futures = []
+        self.is_shut_down = False
+        self.instances.append(self)
+
+    def submit(self, fn, *args, **kwargs):
+        future = LazyFuture(fn, args)
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True, **kwargs):
+        self.is_shut_down = True
+
+
+class TestPipeline(unittest.TestCase):
+    def test_build_in_process(self):
+        pipeline = Pipeline(Foo, workers=0, chunk_size=3)
+        self.assertEqual(list(pipeline.map(records(10))), expected(10))
+
+    def test_build_ordered_in_pool(self):
+        pipeline = Pipeline(Foo, workers=2, chunk_size=3)
+        self.assertEqual(list(pipeline.map(records(50))), expected(50))
+
+    def test_build_unordered_in_pool(self):
+        pipeline = Pipeline(Foo, workers=2, chunk_size=3, ordered=False)
+        self.assertCountEqual(list(pipeline.map(records(50))), expected(50))
+
+    def test_results_are_immutable_values(self):
+        pipeline = Pipeline(Foo, workers=1)
+        foo = next(pipeline.map(records(1)))
+        self.assertIsInstance(foo, Foo)
+        with self.assertRaises(AttributeError):
+            foo.bar = 3
+
+    def test_source_objects(self):
+        pipeline = Pipeline(Foo, workers=1)
+        result = pipeline.map([FooTuple(bar=1, baz='hi')])
+        self.assertEqual(list(result), [Foo(bar=1, baz='hi')])
+
+    def test_transform(self):
+        pipeline = Pipeline(Foo, transform=swap, workers=1)
+        result = pipeline.map([{'bar': 1, 'baz': 'hi'}])
+        self.assertEqual(list(result), [Foo(bar='hi', baz=1)])
+
+    def test_validation_error_is_raised(self):
+        pipeline = Pipeline(Foo, validate=positive_bar, workers=1)
+        with self.assertRaisesRegex(ValueError, 'negative bar'):
+            list(pipeline.map([{'bar': -1, 'baz': 'hi'}]))
+
+    def test_missing_attribute_raises_attribute_error(self):
+        pipeline = Pipeline(Foo, workers=1)
+        with self.assertRaises(AttributeError):
+            list(pipeline.map([{'bar': 1}]))
+
+    def test_invalid_chunk_size_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Pipeline(Foo, chunk_size=0)
+
+    def test_closing_early_cancels_pending_chunks(self):
+        pipeline = Pipeline(Foo, workers=1, chunk_size=1, max_pending=30)
+        with mock.patch('concurrent.futures.ProcessPoolExecutor',
+                        LazyExecutor):
+            results = pipeline.map(records(30))
+            self.assertEqual(next(results), Foo(bar=0, baz='0'))
+            results.close()
+        executor = LazyExecutor.instances.pop()
+        self.assertTrue(executor.is_shut_down)
+        self.assertEqual([future.cancelled() for future in executor.futures],
+                         [False] + [True] * 29)
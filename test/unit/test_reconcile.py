@@ -0,0 +1,120 @@
+# pylint: disable=blacklisted-name
+
+import gc
+import multiprocessing
+import os
+import tempfile
+import unittest
+import weakref
+
+import ezvalue
+from ezvalue.reconcile import Change, Reconciler
+
+
+class Position(ezvalue.Value):
+    """Value object docstring."""
+
+    account = """Docstring 1."""
+    symbol = """Docstring 2."""
+    amount = """Docstring 3."""
+
+
+class Marker:
+    """A weakly referenceable attribute value."""
+
+
+OLD = [Position(account='a', symbol='X', amount=1),
+       Position(account='a', symbol='Y', amount=2),
+       Position(account='b', symbol='X', amount=3)]
+
+NEW = [Position(account='a', symbol='X', amount=1),
+       Position(account='a', symbol='Y', amount=5),
+       Position(account='c', symbol='X', amount=4)]
+
+EXPECTED = [
+    Change(kind='changed', key=('a', 'Y'), old=OLD[1], new=NEW[1],
+           differences=(('amount', 2, 5),)),
+    Change(kind='added', key=('c', 'X'), old=None, new=NEW[2],
+           differences=()),
+    Change(kind='removed', key=('b', 'X'), old=OLD[2], new=None,
+           differences=()),
+]
+
+
+class TestReconciler(unittest.TestCase):
+    def test_diff_in_memory(self):
+        reconciler = Reconciler(Position, ('account', 'symbol'))
+        self.assertEqual(list(reconciler.diff(OLD, NEW)), EXPECTED)
+
+    def test_diff_partitioned(self):
+        reconciler = Reconciler(Position, ('account', 'symbol'),
+                                partitions=4)
+        self.assertCountEqual(list(reconciler.diff(OLD, NEW)), EXPECTED)
+
+    def test_diff_partitioned_in_pool(self):
+        reconciler = Reconciler(Position, ('account', 'symbol'),
+                                partitions=3, workers=2)
+        self.assertCountEqual(list(reconciler.diff(OLD, NEW)), EXPECTED)
+
+    def test_temporary_files_are_removed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            reconciler = Reconciler(Position, ('account', 'symbol'),
+                                    partitions=2, directory=directory)
+            list(reconciler.diff(OLD, NEW))
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_single_key_is_not_a_tuple(self):
+        reconciler = Reconciler(Position, 'symbol')
+        old = [Position(account='a', symbol='X', amount=1)]
+        new = [Position(account='b', symbol='X', amount=1)]
+        change, = reconciler.diff(old, new)
+        self.assertEqual(change.key, 'X')
+        self.assertEqual(change.differences, (('account', 'a', 'b'),))
+
+    def test_changes_contain_value_objects(self):
+        reconciler = Reconciler(Position, ('account', 'symbol'),
+                                partitions=2)
+        for change in reconciler.diff(OLD, NEW):
+            self.assertIsInstance(change.old or change.new, Position)
+
+    def test_identical_datasets_have_no_changes(self):
+        reconciler = Reconciler(Position, ('account', 'symbol'))
+        self.assertEqual(list(reconciler.diff(OLD, iter(OLD))), [])
+
+    def test_duplicate_key_raises_value_error(self):
+        reconciler = Reconciler(Position, 'account')
+        with self.assertRaisesRegex(ValueError, 'Duplicate'):
+            list(reconciler.diff(OLD, NEW))
+
+    def test_missing_key_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Reconciler(Position, ())
+
+    def test_spilled_rows_are_released(self):
+        references = []
+        alive = []
+
+        def positions():
+            for index in range(20):
+                marker = Marker()
+                references.append(weakref.ref(marker))
+                yield Position(account=str(index), symbol='X', amount=marker)
+            del marker
+            gc.collect()
+            # The last row may still be referenced by the spilling loop.
+            alive.extend(reference for reference in references[:-1]
+                         if reference() is not None)
+
+        reconciler = Reconciler(Position, 'account', partitions=4)
+        list(reconciler.diff(positions(), []))
+        self.assertEqual(alive, [])
+
+    def test_closing_early_waits_for_workers(self):
+        old = [Position(account=str(index), symbol='X', amount=index)
+               for index in range(50)]
+        reconciler = Reconciler(Position, 'account', partitions=20,
+                                workers=2)
+        changes = reconciler.diff(old, [])
+        next(changes)
+        changes.close()
+        self.assertEqual(multiprocessing.active_children(), [])
@@ -2,6 +2,10 @@
 # pylint: disable=unused-variable,attribute-defined-outside-init
 
 import collections
+import os
+import pickle
+import subprocess
+import sys
 import unittest
 
 import ezvalue
@@ -259,3 +263,454 @@ class TestInheritance(unittest.TestCase):
         sub_value = SubValue(first=1, second=2)
 
         self.assertEqual(sub_value.second, 2)
+
+    def test_subclass_mutable_inherits_from_base_mutable(self):
+        class BaseValue(ezvalue.Value):
+            first = """Docstring 1."""
+
+        class SubValue(BaseValue):
+            second = """Docstring 2."""
+
+        self.assertTrue(issubclass(SubValue.Mutable, BaseValue.Mutable))
+        self.assertTrue(issubclass(SubValue.ConcurrentMutable,
+                                   BaseValue.ConcurrentMutable))
+        self.assertTrue(issubclass(SubValue.ConcurrentMutable,
+                                   SubValue.Mutable))
+        self.assertIs(SubValue.Mutable.Immutable, SubValue)
+        mutable_value = SubValue(first=1, second=2).to_mutable()
+        self.assertIsInstance(mutable_value, BaseValue.Mutable)
+        self.assertEqual(mutable_value.to_immutable(),
+                         SubValue(first=1, second=2))
+
+    def test_subclass_fields_extend_base_fields(self):
+        class BaseValue(ezvalue.Value):
+            second = """Docstring 1."""
+            first = """Docstring 2."""
+
+        class SubValue(BaseValue):
+            third = """Docstring 3."""
+
+        self.assertEqual(SubValue._fields, ('second', 'first', 'third'))
+        self.assertEqual(SubValue.Mutable._fields, SubValue._fields)
+
+    def test_attribute_overridden_by_method_is_removed(self):
+        class BaseValue(ezvalue.Value):
+            first = """Docstring 1."""
+            second = """Docstring 2."""
+
+        class SubValue(BaseValue):
+            def second(self):
+                return 2
+
+        self.assertEqual(SubValue._fields, ('first',))
+
+    def test_attributes_of_mixin_classes(self):
+        class Mixin:
+            mixed = """Docstring 1."""
+
+            def method(self):
+                return 1
+
+        class MixedValue(ezvalue.Value, Mixin):
+            own = """Docstring 2."""
+
+        self.assertCountEqual(MixedValue._fields, ('mixed', 'own'))
+
+
+class TestDirtyTracking(unittest.TestCase):
+    def test_to_mutable_has_no_changes(self):
+        mutable_foo = Foo(bar=1, baz='hi').to_mutable()
+        self.assertEqual(mutable_foo.changed_attributes(), frozenset())
+
+    def test_assignment_is_tracked(self):
+        mutable_foo = Foo(bar=1, baz='hi').to_mutable()
+        mutable_foo.bar = 2
+        self.assertEqual(mutable_foo.changed_attributes(), {'bar'})
+
+    def test_deletion_is_tracked(self):
+        mutable_foo = Foo(bar=1, baz='hi').to_mutable()
+        del mutable_foo.baz
+        self.assertEqual(mutable_foo.changed_attributes(), {'baz'})
+
+    def test_extra_attributes_are_not_tracked(self):
+        mutable_foo = Foo(bar=1, baz='hi').to_mutable()
+        mutable_foo.spam = 3
+        self.assertEqual(mutable_foo.changed_attributes(), frozenset())
+
+    def test_kwargs_are_tracked_as_changes(self):
+        mutable_foo = Foo.Mutable(Foo(bar=1, baz='hi'), baz='bye')
+        self.assertEqual(mutable_foo.changed_attributes(), {'baz'})
+
+    def test_without_origin_all_assigned_attributes_are_changes(self):
+        mutable_foo = Foo.Mutable(bar=1)
+        self.assertEqual(mutable_foo.changed_attributes(), {'bar'})
+
+    def test_unchanged_to_immutable_returns_origin(self):
+        foo = Foo(bar=1, baz='hi')
+        self.assertIs(foo.to_mutable().to_immutable(), foo)
+
+    def test_changed_to_immutable_returns_new_value(self):
+        foo = Foo(bar=1, baz='hi')
+        mutable_foo = foo.to_mutable()
+        mutable_foo.bar = 2
+        new_foo = mutable_foo.to_immutable()
+        self.assertEqual(new_foo, Foo(bar=2, baz='hi'))
+        self.assertEqual(foo.bar, 1)
+        with self.assertRaises(AttributeError):
+            new_foo.bar = 3
+
+    def test_changed_to_immutable_has_correct_hash(self):
+        foo = Foo(bar=1, baz='hi')
+        hash(foo)
+        mutable_foo = foo.to_mutable()
+        mutable_foo.baz = 'bye'
+        self.assertEqual(hash(mutable_foo.to_immutable()),
+                         hash(Foo(bar=1, baz='bye')))
+
+    def test_to_immutable_with_deleted_attribute_raises_exception(self):
+        mutable_foo = Foo(bar=1, baz='hi').to_mutable()
+        del mutable_foo.bar
+        with self.assertRaises(AttributeError):
+            mutable_foo.to_immutable()
+
+    def test_to_immutable_with_custom_init_uses_constructor(self):
+        class Checked(ezvalue.Value):
+            bar = """Docstring."""
+
+            def __init__(self, source=None, **kwargs):
+                super().__init__(source, **kwargs)
+                if self.bar < 0:
+                    raise ValueError('negative')
+
+        mutable_value = Checked(bar=1).to_mutable()
+        mutable_value.bar = -1
+        with self.assertRaises(ValueError):
+            mutable_value.to_immutable()
+
+    def test_mutable_hash_follows_changes(self):
+        foo = Foo(bar=1, baz='hi')
+        mutable_foo = foo.to_mutable()
+        self.assertEqual(hash(mutable_foo), hash(foo))
+        mutable_foo.bar = 2
+        self.assertEqual(hash(mutable_foo), hash(Foo(bar=2, baz='hi')))
+
+    def test_mutable_compares_to_origin(self):
+        foo = Foo(bar=1, baz='hi')
+        mutable_foo = foo.to_mutable()
+        mutable_foo.bar = 1
+        self.assertTrue(mutable_foo == foo)
+        self.assertTrue(foo == mutable_foo)
+        mutable_foo.bar = 2
+        self.assertFalse(mutable_foo == foo)
+        self.assertFalse(foo == mutable_foo)
+
+    def test_values_with_different_cached_hashes_are_inequal(self):
+        foo1 = Foo(bar=1, baz='hi')
+        foo2 = Foo(bar=2, baz='hi')
+        hash(foo1)
+        hash(foo2)
+        self.assertFalse(foo1 == foo2)
+
+    def test_hash_of_mutable_attributes_is_not_cached(self):
+        inner = Foo.Mutable(bar=1, baz=2)
+        foo = Foo(bar=inner, baz=0)
+        hash(foo)
+        inner.bar = 5
+        self.assertNotIn('_hash', foo.__dict__)
+        self.assertTrue(foo == Foo(bar=Foo.Mutable(bar=5, baz=2), baz=0))
+        self.assertEqual(hash(foo),
+                         hash(Foo(bar=Foo.Mutable(bar=5, baz=2), baz=0)))
+
+    def test_hash_of_nested_values_is_cached(self):
+        foo = Foo(bar=Foo(bar=1, baz=(2, 'hi')), baz=None)
+        hash(foo)
+        self.assertIn('_hash', foo.__dict__)
+
+    def test_evolve_does_not_cache_hash_of_mutable_attribute(self):
+        foo = Foo(bar=1, baz='hi')
+        hash(foo)
+        mutable_foo = foo.to_mutable()
+        mutable_foo.bar = Foo.Mutable(bar=1)
+        self.assertNotIn('_hashes', mutable_foo.to_immutable().__dict__)
+
+    def test_pickle_does_not_contain_cached_hashes(self):
+        foo = Foo(bar=1, baz='hi')
+        hash(foo)
+        copy = pickle.loads(pickle.dumps(foo))
+        self.assertEqual(copy, foo)
+        self.assertNotIn('_hash', copy.__dict__)
+        self.assertNotIn('_hashes', copy.__dict__)
+
+
+class TestView(unittest.TestCase):
+    def test_view_on_mapping(self):
+        view = Foo.view({'bar': 1, 'baz': 'hi'})
+        self.assertEqual(view.bar, 1)
+        self.assertEqual(view.baz, 'hi')
+
+    def test_view_on_object(self):
+        FooTuple = collections.namedtuple('FooTuple', ('bar', 'baz'))
+        view = Foo.view(FooTuple(bar=1, baz='hi'))
+        self.assertEqual(view.bar, 1)
+
+    def test_attributes_are_fetched_lazily_and_once(self):
+        fetched = []
+
+        class Source:
+            def __getattr__(self, name):
+                fetched.append(name)
+                return name
+
+        view = Foo.view(Source())
+        self.assertEqual(fetched, [])
+        self.assertEqual(view.bar, 'bar')
+        self.assertEqual(view.bar, 'bar')
+        self.assertEqual(fetched, ['bar'])
+
+    def test_missing_attribute_raises_on_access(self):
+        view = Foo.view({'bar': 1})
+        self.assertEqual(view.bar, 1)
+        with self.assertRaises(AttributeError):
+            view.baz
+
+    def test_unknown_attribute_raises_attribute_error(self):
+        view = Foo.view({'bar': 1, 'baz': 'hi', 'spam': 3})
+        with self.assertRaises(AttributeError):
+            view.spam
+
+    def test_view_is_read_only(self):
+        view = Foo.view({'bar': 1, 'baz': 'hi'})
+        with self.assertRaises(AttributeError):
+            view.bar = 2
+        with self.assertRaises(AttributeError):
+            del view.bar
+
+    def test_iterate_over_attributes(self):
+        view = Foo.view({})
+        self.assertCountEqual(iter(view), ('bar', 'baz'))
+
+    def test_compares_equal_to_value_and_mutable(self):
+        view = Foo.view({'bar': 1, 'baz': 'hi'})
+        self.assertTrue(view == Foo(bar=1, baz='hi'))
+        self.assertTrue(Foo(bar=1, baz='hi') == view)
+        self.assertTrue(view == Foo.Mutable(bar=1, baz='hi'))
+        self.assertTrue(Foo.Mutable(bar=1, baz='hi') == view)
+        self.assertFalse(view == Foo(bar=2, baz='hi'))
+        self.assertFalse(view == {'bar': 1, 'baz': 'hi'})
+
+    def test_hash_equals_value_hash(self):
+        view = Foo.view({'bar': 1, 'baz': 'hi'})
+        self.assertEqual(hash(view), hash(Foo(bar=1, baz='hi')))
+
+    def test_hash_of_mutable_attributes_is_not_cached(self):
+        inner = Foo.Mutable(bar=1, baz=2)
+        view = Foo.view({'bar': inner, 'baz': 0})
+        hash(view)
+        inner.bar = 5
+        self.assertEqual(hash(view),
+                         hash(Foo(bar=Foo.Mutable(bar=5, baz=2), baz=0)))
+
+    def test_repr(self):
+        view = Foo.view({'bar': 1, 'baz': 'hi'})
+        self.assertIn('ViewFoo', repr(view))
+        self.assertIn("baz='hi'", repr(view))
+
+    def test_pickled_view_hash_is_valid_in_other_process(self):
+        code = ('import pickle, sys\n'
+                'from test.unit.test_value import Foo\n'
+                "view = Foo.view({'bar': 'abc', 'baz': 'def'})\n"
+                'hash(view)\n'
+                'sys.stdout.write(pickle.dumps(view).hex())\n')
+        environment = dict(os.environ, PYTHONHASHSEED='1')
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         env=environment)
+        view = pickle.loads(bytes.fromhex(output.decode()))
+        foo = Foo(bar='abc', baz='def')
+        self.assertEqual(hash(view), hash(foo))
+        self.assertIn(view, {foo})
+
+    def test_materialize(self):
+        foo = Foo.view({'bar': 1, 'baz': 'hi'}).materialize()
+        self.assertIs(type(foo), Foo)
+        self.assertEqual(foo, Foo(bar=1, baz='hi'))
+
+
+class TestFieldOrder(unittest.TestCase):
+    def test_fields_in_definition_order(self):
+        class Ordered(ezvalue.Value):
+            zulu = """Docstring 1."""
+            alpha = """Docstring 2."""
+
+        self.assertEqual(Ordered._fields, ('zulu', 'alpha'))
+
+    def test_base_class_fields_first(self):
+        class BaseValue(ezvalue.Value):
+            second = """Docstring 1."""
+
+        class SubValue(BaseValue):
+            first = """Docstring 2."""
+
+        self.assertEqual(SubValue._fields, ('second', 'first'))
+
+
+class Publisher:
+    """Attribute that publishes new attributes when it is compared."""
+
+    def __init__(self, target, **changes):
+        self.target = target
+        self.changes = changes
+
+    def __eq__(self, other):
+        self.target.update(**self.changes)
+        return True
+
+    __hash__ = object.__hash__
+
+
+class TestConcurrentMutableValueObject(unittest.TestCase,
+                                       _TestValueObjectBase):
+    CUT = Foo.ConcurrentMutable   # Class Under Test
+    class_name = 'ConcurrentMutableFoo'
+
+    def test_is_mutable(self):
+        foo = self.CUT(bar=1)
+        foo.baz = 'hi'
+        self.assertEqual(foo, Foo(bar=1, baz='hi'))
+        self.assertIsInstance(foo, Foo.Mutable)
+
+    def test_update(self):
+        foo = self.CUT(bar=1, baz='hi')
+        foo.update(bar=2, baz='bye', spam=3)
+        self.assert_attribute_values_equal(foo, 2, 'bye')
+        self.assertEqual(foo.spam, 3)
+
+    def test_missing_attribute_raises_attribute_error(self):
+        foo = self.CUT(bar=1)
+        with self.assertRaises(AttributeError):
+            foo.baz
+
+    def test_delete_attribute(self):
+        foo = self.CUT(bar=1, baz='hi')
+        del foo.bar
+        self.assertFalse(hasattr(foo, 'bar'))
+        with self.assertRaises(AttributeError):
+            del foo.bar
+
+    def test_snapshot_is_not_affected_by_changes(self):
+        foo = self.CUT(bar=1, baz='hi')
+        snapshot = foo.snapshot()
+        foo.bar = 2
+        self.assertEqual(snapshot, Foo(bar=1, baz='hi'))
+        with self.assertRaises(AttributeError):
+            snapshot.bar = 3
+
+    def test_to_immutable(self):
+        foo = self.CUT(bar=1, baz='hi')
+        self.assertEqual(foo.to_immutable(), Foo(bar=1, baz='hi'))
+
+    def test_to_immutable_with_missing_attribute_raises_exception(self):
+        with self.assertRaises(AttributeError):
+            self.CUT(bar=1).to_immutable()
+
+    def test_changes_relative_to_origin(self):
+        foo = Foo(bar=1, baz='hi')
+        mutable_foo = self.CUT(foo)
+        self.assertIs(mutable_foo.to_immutable(), foo)
+        mutable_foo.update(bar=2)
+        self.assertEqual(mutable_foo.changed_attributes(), {'bar'})
+        self.assertEqual(mutable_foo.to_immutable(), Foo(bar=2, baz='hi'))
+
+    def test_values_compare_to_a_consistent_snapshot(self):
+        # The concurrent object is first in the state (publisher, 2) and
+        # then in the state (5, 1), but never equal to (0, 1).
+        for other in (Foo(bar=0, baz=1), Foo.view({'bar': 0, 'baz': 1})):
+            foo = self.CUT(baz=2)
+            foo.bar = Publisher(foo, bar=5, baz=1)
+            self.assertFalse(other == foo)
+
+
+class TestRepr(unittest.TestCase):
+    def test_attributes_in_definition_order(self):
+        class Ordered(ezvalue.Value):
+            zulu = """Docstring 1."""
+            alpha = """Docstring 2."""
+
+        self.assertEqual(repr(Ordered(zulu=1, alpha='a')),
+                         "Ordered(zulu=1,alpha='a')")
+        self.assertEqual(str(Ordered(zulu=1, alpha='a')),
+                         'Ordered(zulu=1,alpha=a)')
+        self.assertEqual(repr(Ordered.Mutable(zulu=1, alpha='a')),
+                         "MutableOrdered(zulu=1,alpha='a')")
+
+    def test_repr_is_cached(self):
+        foo = Foo(bar=1, baz='hi')
+        self.assertIs(repr(foo), repr(foo))
+        self.assertIs(str(foo), str(foo))
+
+    def test_repr_of_unhashable_attributes_is_not_cached(self):
+        foo = Foo(bar=[1], baz='hi')
+        repr(foo)
+        str(foo)
+        foo.bar.append(2)
+        self.assertEqual(repr(foo), "Foo(bar=[1, 2],baz='hi')")
+        self.assertEqual(str(foo), 'Foo(bar=[1, 2],baz=hi)')
+
+    def test_repr_of_mutable_attributes_is_not_cached(self):
+        class Obj:
+            def __init__(self):
+                self.state = 1
+
+            def __repr__(self):
+                return 'Obj({})'.format(self.state)
+
+        inner = Foo.Mutable(bar=1, baz=2)
+        obj = Obj()
+        foo = Foo(bar=inner, baz=obj)
+        repr(foo)
+        str(foo)
+        inner.bar = 99
+        obj.state = 2
+        self.assertEqual(repr(foo),
+                         'Foo(bar=MutableFoo(bar=99,baz=2),baz=Obj(2))')
+        self.assertEqual(str(foo),
+                         'Foo(bar=MutableFoo(bar=99,baz=2),baz=Obj(2))')
+
+    def test_repr_of_nested_mutable_attributes_is_not_cached(self):
+        inner = Foo.Mutable(bar=1, baz=2)
+        foo = Foo(bar=Foo(bar=inner, baz=None), baz=None)
+        repr(foo)
+        inner.bar = 99
+        self.assertIn('bar=99', repr(foo))
+
+    def test_nested_repr_is_reused(self):
+        inner = Foo(bar=1, baz='hi')
+        outer = Foo(bar=inner, baz=None)
+        self.assertIn(repr(inner), repr(outer))
+        self.assertIn('_repr', inner.__dict__)
+
+    def test_cached_repr_is_not_copied_to_changed_value(self):
+        foo = Foo(bar=1, baz='hi')
+        repr(foo)
+        mutable_foo = foo.to_mutable()
+        mutable_foo.bar = 2
+        self.assertIn('bar=2', repr(mutable_foo.to_immutable()))
+
+    def test_repr_limit(self):
+        class Limited(ezvalue.Value, repr_limit=5):
+            data = """Docstring."""
+
+        limited = Limited(data='x' * 100)
+        self.assertEqual(repr(limited), "Limited(data='xxxx...)")
+        self.assertEqual(str(limited), 'Limited(data=xxxxx...)')
+        self.assertEqual(repr(limited.to_mutable()),
+                         "MutableLimited(data='xxxx...)")
+
+    def test_repr_limit_is_inherited(self):
+        class Limited(ezvalue.Value, repr_limit=3):
+            data = """Docstring."""
+
+        class SubLimited(Limited):
+            more = """Docstring."""
+
+        self.assertEqual(str(SubLimited(data='abcdef', more=1)),
+                         'SubLimited(data=abc...,more=1)')
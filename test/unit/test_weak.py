@@ -0,0 +1,114 @@
+# pylint: disable=blacklisted-name
+
+import gc
+import unittest
+import weakref
+
+import ezvalue
+from ezvalue.weak import ValueWeakCache
+
+
+class Foo(ezvalue.Value):
+    """Value object docstring."""
+
+    bar = """Docstring 1."""
+    baz = """Docstring 2."""
+
+
+class SlottedFoo(Foo):
+    """Value object that declares empty slots."""
+
+    __slots__ = ()
+
+
+class TestWeakReferences(unittest.TestCase):
+    def test_values_can_be_weakly_referenced(self):
+        foo = Foo(bar=1, baz='hi')
+        self.assertIs(weakref.ref(foo)(), foo)
+
+    def test_companions_can_be_weakly_referenced(self):
+        for foo in (Foo.Mutable(bar=1), Foo.ConcurrentMutable(bar=1),
+                    Foo.view({})):
+            self.assertIs(weakref.ref(foo)(), foo)
+
+    def test_subclasses_declaring_slots_can_be_weakly_referenced(self):
+        for foo in (SlottedFoo(bar=1, baz='hi'), SlottedFoo.Mutable(bar=1)):
+            self.assertIs(weakref.ref(foo)(), foo)
+
+
+class TestIdentityCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ValueWeakCache()
+
+    def test_set_and_get(self):
+        foo = Foo(bar=1, baz='hi')
+        self.cache[foo] = 'data'
+        self.assertEqual(self.cache[foo], 'data')
+        self.assertIn(foo, self.cache)
+
+    def test_equal_values_have_separate_entries(self):
+        foo1 = Foo(bar=1, baz='hi')
+        foo2 = Foo(bar=1, baz='hi')
+        self.cache[foo1] = 'one'
+        self.cache[foo2] = 'two'
+        self.assertEqual(self.cache[foo1], 'one')
+        self.assertEqual(len(self.cache), 2)
+
+    def test_mutable_values_can_be_keys(self):
+        foo = Foo.Mutable(bar=1)
+        self.cache[foo] = 'data'
+        foo.bar = 2
+        self.assertEqual(self.cache[foo], 'data')
+
+    def test_entries_are_removed_when_key_dies(self):
+        foo = Foo(bar=1, baz='hi')
+        self.cache[foo] = 'data'
+        del foo
+        gc.collect()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_delete(self):
+        foo = Foo(bar=1, baz='hi')
+        self.cache[foo] = 'data'
+        del self.cache[foo]
+        self.assertNotIn(foo, self.cache)
+
+    def test_memory_stays_flat(self):
+        for i in range(1000):
+            self.cache[Foo(bar=i, baz='hi')] = i
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestEqualityCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ValueWeakCache(by='equality')
+
+    def test_equal_values_share_an_entry(self):
+        foo1 = Foo(bar=1, baz='hi')
+        self.cache[foo1] = 'data'
+        self.assertEqual(self.cache[Foo(bar=1, baz='hi')], 'data')
+
+    def test_entry_lives_while_any_key_lives(self):
+        foo1 = Foo(bar=1, baz='hi')
+        foo2 = Foo(bar=1, baz='hi')
+        self.cache[foo1] = 'one'
+        self.cache[foo2] = 'two'
+        del foo1
+        gc.collect()
+        self.assertEqual(self.cache[Foo(bar=1, baz='hi')], 'two')
+        del foo2
+        gc.collect()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_iterate_over_live_keys(self):
+        foo = Foo(bar=1, baz='hi')
+        self.cache[foo] = 'data'
+        self.assertEqual(list(self.cache), [foo])
+
+    def test_missing_key_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self.cache[Foo(bar=1, baz='hi')]
+
+    def test_invalid_mode_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            ValueWeakCache(by='spam')